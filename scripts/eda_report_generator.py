@@ -1,40 +1,70 @@
 # src/insurance_analytics/reports/report_generator.py
 
 import argparse
+import csv
+import json
+import logging
 from pathlib import Path
 import pandas as pd
 from typing import Optional
 from insurance_analytics.preprocessing.feature_engineering import add_loss_ratio
-from insurance_analytics.eda.exploration import duplicated_rows, detect_outliers_iqr, summarize_missing
+from insurance_analytics.eda.exploration import (
+    duplicated_rows, detect_outliers_iqr_batch, missing_and_outlier_counts,
+    numeric_columns
+)
 from insurance_analytics.data.load_data import load_data
 
+try:  # faster JSON writer with native numpy support
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class EDAReport:
-    def __init__(self, df: pd.DataFrame, file_name: str):
-        self.df = df.copy()
+    def __init__(self, df: pd.DataFrame, file_name: str, copy: bool = False,
+                 numeric_cols: Optional[list] = None):
+        # The report only reads self.df; pass copy=True for an isolated frame.
+        self.df = df.copy() if copy else df
         self.file_name = file_name
+        # Precomputed numeric column list, e.g. from partition_columns
+        self.numeric_cols = numeric_cols
         self.report = {}
+        # Outlier counts from the fused overview pass, reused by detect_outliers
+        self._outlier_counts = {}
+
+    def _numeric_cols(self):
+        if self.numeric_cols is not None:
+            return self.numeric_cols
+        return numeric_columns(self.df)
 
     def run_overview(self):
         """Capture basic dataset info."""
         self.report["shape"] = self.df.shape
         self.report["columns"] = self.df.dtypes.apply(
             lambda x: str(x)).to_dict()
-        self.report["missing_top20"] = summarize_missing(
-            self.df, top_n=20).to_dict()
+
+        # One sweep over the numeric block yields missing and outlier counts
+        numeric_cols = self._numeric_cols()
+        numeric_missing, self._outlier_counts = missing_and_outlier_counts(
+            self.df, numeric_cols)
+        other_cols = [c for c in self.df.columns if c not in numeric_missing]
+        missing = pd.Series(numeric_missing, dtype="int64").combine_first(
+            self.df[other_cols].isna().sum()).reindex(self.df.columns)
+        self.report["missing_top20"] = (missing.div(len(self.df))
+                                        .sort_values(ascending=False)
+                                        .head(20).to_dict())
         self.report["duplicates"] = duplicated_rows(self.df)
 
     def detect_outliers(self, numeric_cols=None):
         """Detect outliers for numeric columns using IQR."""
         if numeric_cols is None:
-            numeric_cols = self.df.select_dtypes(
-                include="number").columns.tolist()
+            numeric_cols = self._numeric_cols()
 
-        outlier_summary = {}
-        for col in numeric_cols:
-            outliers = detect_outliers_iqr(self.df, col)
-            outlier_summary[col] = len(outliers)
-        self.report["outliers"] = outlier_summary
+        # Only columns not covered by run_overview (e.g. LossRatio) are scanned
+        todo = [c for c in numeric_cols if c not in self._outlier_counts]
+        counts = {**self._outlier_counts,
+                  **detect_outliers_iqr_batch(self.df, todo)}
+        self.report["outliers"] = {c: counts[c] for c in numeric_cols}
 
     def add_loss_ratio(self):
         """Add LossRatio column if missing."""
@@ -42,7 +72,7 @@ class EDAReport:
             self.df = add_loss_ratio(self.df)
 
     def save_report(self, output_dir: Path, format: str = "md"):
-        """Save the report as Markdown."""
+        """Save the report as Markdown, JSON or long-format CSV."""
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
             report_file = output_dir / f"{self.file_name}_eda_report.{format}"
@@ -55,26 +85,57 @@ class EDAReport:
                 for col, dtype in self.report.get("columns", {}).items():
                     lines.append(f"- **{col}**: {dtype}")
 
+                # Each table is one join over a list comprehension; to_markdown
+                # would pull in tabulate, which is not a dependency
                 lines.append("\n## Top 20 Missing Values\n")
-                lines.append("| Column | % Missing |")
-                lines.append("|--------|-----------|")
-                for col, pct in self.report.get("missing_top20", {}).items():
-                    lines.append(f"| {col} | {pct*100:.2f}% |")
+                lines.append("\n".join(
+                    ["| Column | % Missing |", "|--------|-----------|"]
+                    + [f"| {col} | {pct*100:.2f}% |"
+                       for col, pct in self.report.get("missing_top20", {}).items()]))
 
                 lines.append(
                     f"\n## Duplicates\n{self.report.get('duplicates')}\n")
 
                 lines.append("\n## Outliers\n")
-                lines.append("| Column | Outlier Count |")
-                lines.append("|--------|---------------|")
-                for col, count in self.report.get("outliers", {}).items():
-                    lines.append(f"| {col} | {count} |")
+                lines.append("\n".join(
+                    ["| Column | Outlier Count |", "|--------|---------------|"]
+                    + [f"| {col} | {count} |"
+                       for col, count in self.report.get("outliers", {}).items()]))
 
-                with open(report_file, "w", encoding="utf-8") as f:
+                with open(report_file, "w", encoding="utf-8", buffering=1 << 20) as f:
                     f.write("\n".join(lines))
 
+            elif format == "json":
+                if orjson is not None:
+                    payload = orjson.dumps(
+                        self.report,
+                        option=orjson.OPT_INDENT_2
+                        | orjson.OPT_SERIALIZE_NUMPY
+                        | orjson.OPT_NON_STR_KEYS)
+                else:
+                    payload = json.dumps(
+                        self.report, indent=2,
+                        default=lambda o: o.item() if hasattr(o, "item") else str(o)
+                    ).encode("utf-8")
+                with open(report_file, "wb") as f:
+                    f.write(payload)
+
+            elif format == "csv":
+                # one row per (section, key, value); scalars leave key empty
+                rows = []
+                for section, value in self.report.items():
+                    if isinstance(value, dict):
+                        rows.extend((section, k, v) for k, v in value.items())
+                    else:
+                        rows.append((section, "", value))
+                with open(report_file, "w", encoding="utf-8", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(("section", "key", "value"))
+                    writer.writerows(rows)
+
             else:
-                raise ValueError("Unsupported format. Only 'md' is supported.")
+                raise ValueError(
+                    "Unsupported format. Only 'md', 'json' and 'csv' are supported.")
 
             print(f"EDA report saved to {report_file}")
             return report_file
@@ -103,7 +164,7 @@ def main():
     parser.add_argument("--output_dir", type=str, required=True,
                         help="Directory to save the report")
     parser.add_argument("--format", type=str, default="md",
-                        help="Output format (default: md)")
+                        help="Output format: md, json or csv (default: md)")
 
     args = parser.parse_args()
     input_path = Path(args.input)
@@ -128,4 +189,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
@@ -1,14 +1,19 @@
 # run_eda_pipeline.py
 
+import logging
 from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg", force=True)  # headless: plots only go to disk
+import numpy as np
 import pandas as pd
 
 from insurance_analytics.core.registry import settings
-from insurance_analytics.preprocessing.cleaner import cleaning
+from insurance_analytics.preprocessing.cleaner import cleaning, optimize_dtypes
 from insurance_analytics.data.load_data import load_data
 from insurance_analytics.preprocessing.feature_engineering import add_loss_ratio
 from insurance_analytics.eda.exploration import (
-    dataset_overview, duplicated_rows, detect_outliers_iqr
+    dataset_overview, duplicated_rows, count_outliers_iqr, partition_columns
 )
 from insurance_analytics.viz.plots import (
     plot_histogram,
@@ -43,6 +48,13 @@ def run_eda_pipeline(file_name: str):
     print(f"Loading data from {raw_path}...")
     df = load_data(raw_path)
 
+    # Downcast numerics right away so every later pass moves fewer bytes
+    mem_before = df.memory_usage(deep=True).sum()
+    df = optimize_dtypes(df, categorize=False)
+    mem_after = df.memory_usage(deep=True).sum()
+    print(f"Downcast numeric dtypes: {mem_before / 1e6:.1f} MB -> "
+          f"{mem_after / 1e6:.1f} MB")
+
     # -----------------------------
     # Cleaning
     # -----------------------------
@@ -55,6 +67,9 @@ def run_eda_pipeline(file_name: str):
     print("Adding LossRatio feature...")
     df = add_loss_ratio(df)
 
+    # Strings are cleaned by now, so low-cardinality ones can be categorical
+    df = optimize_dtypes(df)
+
     # -----------------------------
     # Dataset Overview
     # -----------------------------
@@ -68,8 +83,14 @@ def run_eda_pipeline(file_name: str):
     # -----------------------------
     # Univariate Analysis
     # -----------------------------
-    numeric_cols = df.select_dtypes(include="number").columns.tolist()
-    cat_cols = df.select_dtypes(include="object").columns.tolist()
+    # Partition columns once and reuse the lists for every step below
+    numeric_cols, cat_cols = partition_columns(df)
+    df.attrs["numeric_cols"] = numeric_cols
+    df.attrs["cat_cols"] = cat_cols
+
+    # Each figure is saved and closed by the plot helper as soon as it is
+    # drawn, so only one figure is alive at a time
+    print(f"Saving plots to {plots_dir}...")
 
     # Plot numeric distributions
     for col in numeric_cols[:5]:  # limit first 5 for speed
@@ -84,14 +105,15 @@ def run_eda_pipeline(file_name: str):
     # Outlier Detection
     # -----------------------------
     for col in numeric_cols[:5]:
-        detect_outliers_iqr(df, col)
-        highlight_outliers_iqr(
-            df, col, save_path=plots_dir / f"{col}_outliers.png")
+        count_outliers_iqr(df, col)
+        highlight_outliers_iqr(df, col, save_path=plots_dir / f"{col}_outliers.png")
 
     # -----------------------------
     # Bivariate / Multivariate Analysis
     # -----------------------------
-    correlation_matrix(df, save_path=plots_dir / "correlation_matrix.png")
+    # float32 is plenty for EDA correlations and halves the bytes moved
+    df_num32 = df[numeric_cols].astype(np.float32, copy=False)
+    correlation_matrix(df_num32, save_path=plots_dir / "correlation_matrix.png")
 
     if "TotalPremium" in df.columns and "TotalClaims" in df.columns:
         scatter_by_group(df, x_col="TotalPremium", y_col="TotalClaims",
@@ -102,10 +124,12 @@ def run_eda_pipeline(file_name: str):
     # Save cleaned & processed dataset
     # -----------------------------
     processed_file = processed_dir / \
-        f"{file_name.replace('.txt', '_cleaned.csv')}"
-    df.to_csv(processed_file, index=False)
+        f"{Path(file_name).stem}_cleaned.parquet"
+    df.to_parquet(processed_file, engine="pyarrow",
+                  compression="zstd", index=False)
     print(f"\nProcessed dataset saved to {processed_file}")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     run_eda_pipeline("MachineLearningRating_v3.txt")
@@ -1,14 +1,22 @@
+import copy
 from pathlib import Path
 import yaml
 import logging
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configs keyed by (path, mtime_ns); an edited file is re-read
+_config_cache: dict = {}
+
 
 def load_config(path: str | None = None) -> dict:
     """
     Load a YAML configuration file safely.
     If path is None, load from top-level configs folder.
+    Parsed files are cached until their modification time changes.
     """
     if path is None:
         from insurance_analytics.utils.project_root import get_project_root
@@ -20,14 +28,19 @@ def load_config(path: str | None = None) -> dict:
             logger.error(f"Config file not found: {path.resolve()}")
             return {}
 
+        key = (str(path.resolve()), path.stat().st_mtime_ns)
+        if key in _config_cache:
+            return copy.deepcopy(_config_cache[key])
+
         with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
 
         if not isinstance(data, dict):
             logger.error(f"Config root must be a dictionary: {path.resolve()}")
             return {}
 
-        return data
+        _config_cache[key] = data
+        return copy.deepcopy(data)
 
     except yaml.YAMLError as e:
         logger.error(f"YAML parsing error in {path.resolve()}: {e}")
@@ -1,5 +1,7 @@
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Set
 from insurance_analytics.utils.project_root import get_project_root
 from insurance_analytics.utils.validation import validate_config_structure
 from insurance_analytics.core.config import load_config
@@ -21,6 +23,7 @@ DEFAULT_STRUCTURE = {
         "model_dir": "src/insurance_analytics/models",
         "checkpoints": "src/insurance_analytics/models/checkpoints"
     },
+    "artifacts": {"artifacts_dir": "artifacts"},
     "docs": {"docs_dir": "docs"},
     "notebooks": {"notebooks_dir": "notebooks"},
     "scripts": {"scripts_dir": "scripts"},
@@ -28,10 +31,27 @@ DEFAULT_STRUCTURE = {
 }
 
 
+def _leaf_dirs(paths: Iterable[Path]) -> List[Path]:
+    """Return the deepest unique paths; mkdir(parents=True) covers the rest."""
+    unique = sorted(set(paths), key=lambda p: len(p.parts), reverse=True)
+    leaves: List[Path] = []
+    for path in unique:
+        if not any(path in leaf.parents for leaf in leaves):
+            leaves.append(path)
+    return leaves
+
+
 class PathRegistry:
     """Read paths from config + defaults and resolve relative to root."""
 
-    def __init__(self, root: Path, config: Optional[Dict] = None, create_dirs: bool = True):
+    def __init__(self, root: Path, config: Optional[Dict] = None, create_dirs: bool = True,
+                 existing_dirs: Optional[Set[Path]] = None):
+        """
+        ``existing_dirs`` is an optional caller-owned set of directories known
+        to exist; they are neither stat'ed nor created again, and every
+        directory this registry creates (with its parents) is added to it, so
+        registries built over the same tree can share one set.
+        """
         self.root = Path(root).resolve()
         self._create_dirs = create_dirs
 
@@ -50,19 +70,31 @@ class PathRegistry:
         validate_config_structure(self.config)
 
         # Create sections dynamically
+        all_paths: List[Path] = []
         for section, keys in DEFAULT_STRUCTURE.items():
-            setattr(self, section, self._init_section(
-                section, self.config[section]))
+            container = self._init_section(section, self.config[section])
+            all_paths.extend(container.values())
+            setattr(self, section, container)
+
+        # Directories shared across sections (e.g. data/ and data/raw) are
+        # created once, deepest first
+        if self._create_dirs:
+            known = existing_dirs if existing_dirs is not None else set()
+            for path in _leaf_dirs(all_paths):
+                if path in known:
+                    continue
+                if not path.is_dir():
+                    os.makedirs(path, exist_ok=True)
+                known.add(path)
+                known.update(path.parents)
 
     def _init_section(self, section: str, section_config: Dict[str, str]) -> Dict[str, Path]:
-        """Resolve section paths and create directories."""
-        container: Dict[str, Path] = {}
-        for key, rel_path in section_config.items():
-            path = (self.root / rel_path).resolve()
-            if self._create_dirs:
-                path.mkdir(parents=True, exist_ok=True)
-            container[key] = path
-        return container
+        """Resolve section paths relative to root."""
+        # root is resolved once in __init__, so joining + normpath is enough
+        return {
+            key: Path(os.path.normpath(self.root / rel_path))
+            for key, rel_path in section_config.items()
+        }
 
 
 class Settings:
@@ -90,6 +122,10 @@ class Settings:
     def MODELS(self) -> Dict[str, Path]:
         return self.paths.models
 
+    @property
+    def ARTIFACTS(self) -> Dict[str, Path]:
+        return self.paths.artifacts
+
     @property
     def DOCS(self) -> Dict[str, Path]:
         return self.paths.docs
@@ -107,5 +143,16 @@ class Settings:
         return self.paths.tests
 
 
-# global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the shared Settings instance on first use."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Lazily create the global ``settings`` so importing this module does
+    # not resolve the project root, parse YAML or create directories.
+    if name == "settings":
+        globals()["settings"] = get_settings()
+        return globals()["settings"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,36 +1,86 @@
 # src/insurance_analytics/eda/exploration.py
 
+import logging
+import warnings
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+try:  # optional accelerator, installed with the "fast" extra
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba not installed
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# Column count above which the numba kernel beats np.nanquantile
+NUMBA_MIN_COLS = 32
 
 # -------------------------------------------------------------
 # 1) STRUCTURAL SUMMARY
 # -------------------------------------------------------------
+def numeric_columns(df: pd.DataFrame) -> List[str]:
+    """
+    Return the names of integer and float columns.
+
+    Reads dtype kinds directly instead of going through
+    ``select_dtypes``, which builds an intermediate frame.
+    """
+    return [c for c, dt in zip(df.columns, df.dtypes.values) if dt.kind in "iuf"]
+
+
+def partition_columns(df: pd.DataFrame) -> Tuple[List[str], List[str]]:
+    """
+    Split columns into (numeric, categorical) in one walk over the dtypes.
+
+    Numeric means integer or float; categorical covers object, string and
+    category columns. Other dtypes (bool, datetime) are in neither list.
+    """
+    numeric_cols, cat_cols = [], []
+    for c, dt in zip(df.columns, df.dtypes.values):
+        if dt.kind in "iuf":
+            numeric_cols.append(c)
+        elif dt.kind == "O":
+            cat_cols.append(c)
+    return numeric_cols, cat_cols
+
+
 def dataset_overview(df: pd.DataFrame):
     """
     Returns basic overview: shape, column names, dtypes.
     """
-    print("\n--- Dataset Shape ---")
-    print(df.shape)
-
-    print("\n--- Column Info ---")
-    print(df.dtypes)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n--- Dataset Shape ---\n%s", df.shape)
+        logger.info("\n--- Column Info ---\n%s", df.dtypes)
 
-    print("\n--- Total Missing Values (%) ---")
-    print((df.isna().mean() * 100).sort_values(ascending=False).head(20))
+        # integer null counts scaled once, instead of a float mean per cell
+        missing_pct = df.isna().sum().div(len(df) / 100.0)
+        logger.info("\n--- Total Missing Values (%%) ---\n%s",
+                    missing_pct.sort_values(ascending=False).head(20))
     df=df.head(5)
     return df
 
 
-def duplicated_rows(df: pd.DataFrame):
+def duplicated_rows(df: pd.DataFrame, use_cache: bool = True):
     """
     Count duplicated rows in the dataset.
+
+    The count is stored in ``df.attrs["duplicated_rows"]`` together with the
+    frame's id and shape, so repeated calls on the same frame skip the row
+    hashing. pandas copies ``attrs`` onto derived frames, which is why the
+    entry is only reused when the id matches. Pass ``use_cache=False`` after
+    mutating values in place.
     """
-    dup_count = df.duplicated().sum()
-    print(f"Duplicated rows: {dup_count}")
+    cached = df.attrs.get("duplicated_rows")
+    if use_cache and cached is not None and cached[:2] == (id(df), df.shape):
+        dup_count = cached[2]
+    else:
+        dup_count = int(df.duplicated().sum())
+        df.attrs["duplicated_rows"] = (id(df), df.shape, dup_count)
+    logger.info("Duplicated rows: %s", dup_count)
     return dup_count
 # -------------------------------------------------------------
 # 2) MISSING DATA INSPECTION
@@ -51,24 +101,220 @@ def summarize_missing(df: pd.DataFrame, top_n: Optional[int] = 20) -> pd.Series:
     pd.Series
         Missing values as a fraction of total rows, sorted descending.
     """
-    missing_pct = df.isna().mean().sort_values(ascending=False)
+    missing_pct = df.isna().sum().div(len(df)).sort_values(ascending=False)
     return missing_pct.head(top_n)
 # -------------------------------------------------------------
 # 3) OUTLIER INSPECTION
 # -------------------------------------------------------------
-def detect_outliers_iqr(df: pd.DataFrame, col: str):
-    """
-    Use IQR rule to detect outliers for a numeric column.
-    """
+def _is_degenerate(col_data: pd.Series) -> bool:
+    """True for all-NaN or constant columns, which cannot have IQR outliers."""
+    lo, hi = col_data.min(), col_data.max()
+    return pd.isna(lo) or lo == hi
+
+
+def _degenerate_columns(arr: np.ndarray) -> np.ndarray:
+    """Boolean vector flagging all-NaN or constant columns of a 2-D array."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN slices
+        lo = np.nanmin(arr, axis=0)
+        hi = np.nanmax(arr, axis=0)
+    return np.isnan(lo) | (lo == hi)
+
+
+def _iqr_outlier_mask(df: pd.DataFrame, col: str) -> pd.Series:
+    """Boolean mask of rows outside the 1.5 * IQR fences of ``col``."""
     if col not in df.columns:
         raise ValueError(f"{col} not found in DataFrame")
 
-    q1 = df[col].quantile(0.25)
-    q3 = df[col].quantile(0.75)
+    q1, q3 = df[col].quantile([0.25, 0.75])
     iqr = q3 - q1
     lower = q1 - 1.5 * iqr
     upper = q3 + 1.5 * iqr
+    return (df[col] < lower) | (df[col] > upper)
+
+
+def detect_outliers_iqr(df: pd.DataFrame, col: str):
+    """
+    Use IQR rule to detect outliers for a numeric column.
 
-    outliers = df[(df[col] < lower) | (df[col] > upper)]
-    print(f"{col}: {len(outliers)} outliers detected")
+    .. deprecated::
+        Materializes every outlier row. Use :func:`count_outliers_iqr`
+        when only the number of outliers is needed.
+    """
+    warnings.warn(
+        "detect_outliers_iqr is deprecated; use count_outliers_iqr when "
+        "only the outlier count is needed",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    if col in df.columns and _is_degenerate(df[col]):
+        return df.iloc[0:0]
+    outliers = df[_iqr_outlier_mask(df, col)]
+    logger.debug("%s: %d outliers detected", col, len(outliers))
     return outliers
+
+
+def count_outliers_iqr(df: pd.DataFrame, col: str) -> int:
+    """
+    Count IQR-rule outliers for a numeric column without building
+    the filtered DataFrame.
+    """
+    if col in df.columns and _is_degenerate(df[col]):
+        return 0
+    count = int(_iqr_outlier_mask(df, col).sum())
+    logger.debug("%s: %d outliers detected", col, count)
+    return count
+
+
+def detect_outliers_iqr_batch(df: pd.DataFrame, cols: List[str]) -> Dict[str, int]:
+    """
+    Count IQR-rule outliers for several numeric columns in a single pass.
+
+    Quantiles, bounds and the outlier mask are computed on the 2-D numeric
+    block at once instead of column by column.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The dataset to analyze.
+    cols : list of str
+        Numeric columns to inspect.
+
+    Returns
+    -------
+    dict
+        Mapping of column name to number of outliers.
+    """
+    missing = [c for c in cols if c not in df.columns]
+    if missing:
+        raise ValueError(f"{missing} not found in DataFrame")
+    if not cols:
+        return {}
+
+    arr = df[cols].to_numpy(dtype=float, copy=False)
+    # all-NaN and constant columns (policy flags, ids) have no outliers
+    keep = ~_degenerate_columns(arr)
+    counts = np.zeros(len(cols), dtype=np.int64)
+    if not keep.any():
+        return dict(zip(cols, counts.tolist()))
+    if not keep.all():
+        arr = arr[:, keep]
+
+    if njit is not None and arr.shape[1] > NUMBA_MIN_COLS:
+        counts[keep] = numba_iqr_counts(arr)
+        return dict(zip(cols, counts.tolist()))
+
+    q1, q3 = np.nanquantile(arr, [0.25, 0.75], axis=0)
+    iqr = q3 - q1
+    mask = (arr < (q1 - 1.5 * iqr)) | (arr > (q3 + 1.5 * iqr))
+    counts[keep] = mask.sum(axis=0)
+    return dict(zip(cols, counts.tolist()))
+
+
+def _sorted_quantile(col, q):
+    # Linear interpolation, matching np.quantile's default method
+    pos = q * (col.size - 1)
+    lo = int(np.floor(pos))
+    hi = min(lo + 1, col.size - 1)
+    return col[lo] + (pos - lo) * (col[hi] - col[lo])
+
+
+def _iqr_counts_kernel(arr):
+    n, m = arr.shape
+    out = np.zeros(m, np.int64)
+    for j in prange(m):
+        col = arr[:, j]
+        col = np.sort(col[~np.isnan(col)])
+        if col.size == 0:
+            continue
+        q1 = _sorted_quantile(col, 0.25)
+        q3 = _sorted_quantile(col, 0.75)
+        iqr = q3 - q1
+        lower = q1 - 1.5 * iqr
+        upper = q3 + 1.5 * iqr
+        count = 0
+        for v in col:
+            if v < lower or v > upper:
+                count += 1
+        out[j] = count
+    return out
+
+
+def _missing_outlier_kernel(arr, q1, q3):
+    n, m = arr.shape
+    miss = np.zeros(m, np.int64)
+    out = np.zeros(m, np.int64)
+    for j in prange(m):
+        iqr = q3[j] - q1[j]
+        lower = q1[j] - 1.5 * iqr
+        upper = q3[j] + 1.5 * iqr
+        for i in range(n):
+            v = arr[i, j]
+            if np.isnan(v):
+                miss[j] += 1
+            elif v < lower or v > upper:
+                out[j] += 1
+    return miss, out
+
+
+if njit is not None:
+    _sorted_quantile = njit(cache=True)(_sorted_quantile)
+    _iqr_counts_kernel = njit(parallel=True, cache=True)(_iqr_counts_kernel)
+    _missing_outlier_kernel = njit(parallel=True, cache=True)(
+        _missing_outlier_kernel)
+
+
+def numba_iqr_counts(arr: np.ndarray) -> np.ndarray:
+    """
+    Count IQR-rule outliers per column of a 2-D float array with numba.
+
+    Each column is sorted once and the quartiles, bounds and count are
+    derived from it in the same loop; columns run in parallel.
+    NaNs are ignored, as in ``np.nanquantile``.
+    """
+    if njit is None:
+        raise ImportError("numba is required for numba_iqr_counts")
+    return _iqr_counts_kernel(np.ascontiguousarray(arr, dtype=np.float64))
+
+
+def missing_and_outlier_counts(
+    df: pd.DataFrame, cols: List[str]
+) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Count missing values and IQR-rule outliers for numeric columns together.
+
+    After the quartiles are known, a single sweep over the numeric block
+    counts both NaNs and values outside the fences (numba when installed,
+    NumPy otherwise). All-NaN and constant columns skip the quartiles and
+    sweep: they have no outliers, so only their NaNs are counted.
+
+    Returns
+    -------
+    tuple of dict
+        (missing counts, outlier counts), each keyed by column name.
+    """
+    missing = [c for c in cols if c not in df.columns]
+    if missing:
+        raise ValueError(f"{missing} not found in DataFrame")
+    if not cols:
+        return {}, {}
+
+    arr = df[cols].to_numpy(dtype=float, copy=False)
+    # all-NaN and constant columns have no outliers; with them removed no
+    # quantile sees an all-NaN slice
+    keep = ~_degenerate_columns(arr)
+    miss = np.zeros(len(cols), dtype=np.int64)
+    out = np.zeros(len(cols), dtype=np.int64)
+    if not keep.all():
+        miss[~keep] = np.isnan(arr[:, ~keep]).sum(axis=0)
+    if keep.any():
+        sub = arr if keep.all() else arr[:, keep]
+        q1, q3 = np.nanquantile(sub, [0.25, 0.75], axis=0)
+        if njit is not None:
+            miss[keep], out[keep] = _missing_outlier_kernel(
+                np.asfortranarray(sub, dtype=np.float64), q1, q3)
+        else:
+            iqr = q3 - q1
+            miss[keep] = np.isnan(sub).sum(axis=0)
+            out[keep] = ((sub < (q1 - 1.5 * iqr)) | (sub > (q3 + 1.5 * iqr))).sum(axis=0)
+    return dict(zip(cols, miss.tolist())), dict(zip(cols, out.tolist()))
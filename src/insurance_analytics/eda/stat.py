@@ -7,7 +7,8 @@ from typing import List, Optional
 def descriptive_statistics(
     df: pd.DataFrame,
     numeric_cols: Optional[List[str]] = None,
-    round_digits: int = 2
+    round_digits: int = 2,
+    downcast: bool = True
 ) -> pd.DataFrame:
     """
     Generate descriptive statistics (count, mean, median, std, min, max)
@@ -21,6 +22,10 @@ def descriptive_statistics(
         Columns to summarize. If None, all numeric columns will be summarized.
     round_digits : int
         Number of decimal places to round the statistics.
+    downcast : bool
+        If True, integer and float columns are downcast to the smallest
+        dtype that holds them before aggregating, so each statistic reads
+        fewer bytes. Pass False for full float64 precision.
 
     Returns:
     --------
@@ -30,7 +35,13 @@ def descriptive_statistics(
     if numeric_cols is None:
         numeric_cols = df.select_dtypes(include='number').columns.tolist()
 
-    stats = df[numeric_cols].agg(
+    data = df[numeric_cols]
+    if downcast:
+        data = data.apply(
+            lambda s: pd.to_numeric(
+                s, downcast='integer' if s.dtype.kind in 'iu' else 'float'))
+
+    stats = data.agg(
         ['count', 'mean', 'median', 'std', 'min', 'max'])
     stats = stats.round(round_digits).T  # Transpose for easier reading
     stats.index.name = "Column"
@@ -9,7 +9,25 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 import matplotlib.pyplot as plt
-import seaborn as sns
+
+try:  # optional accelerator, installed with the "fast" extra
+    from numba import njit
+except ImportError:  # pragma: no cover - numba not installed
+    njit = None
+
+
+def _welch_t(m_a, v_a, n_a, m_b, v_b, n_b):
+    # Welch t-statistic and Satterthwaite degrees of freedom per feature
+    se_a = v_a / n_a
+    se_b = v_b / n_b
+    se = se_a + se_b
+    t_stat = (m_a - m_b) / np.sqrt(se)
+    dof = se ** 2 / (se_a ** 2 / (n_a - 1) + se_b ** 2 / (n_b - 1))
+    return t_stat, dof
+
+
+if njit is not None:
+    _welch_t = njit(parallel=True, cache=True, error_model='numpy')(_welch_t)
 
 def check_balance(df_control, df_test, confounders, plot=False):
     """
@@ -31,18 +49,34 @@ def check_balance(df_control, df_test, confounders, plot=False):
     pd.DataFrame
         Summary table with balance check results
     """
+    # Stack both groups once and aggregate every numeric confounder together
+    combined = pd.concat(
+        [df_control[confounders].assign(_g=0), df_test[confounders].assign(_g=1)],
+        ignore_index=True,
+    )
+    numeric_cols = combined[confounders].select_dtypes(include='number').columns.tolist()
+    numeric_stats = {}
+    if numeric_cols:
+        agg = combined.groupby('_g')[numeric_cols].agg(['mean', 'count', 'var'])
+        mean = agg.xs('mean', axis=1, level=1).reindex([0, 1]).to_numpy(dtype=float)
+        count = agg.xs('count', axis=1, level=1).reindex([0, 1]).to_numpy(dtype=float)
+        var = agg.xs('var', axis=1, level=1).reindex([0, 1]).to_numpy(dtype=float)
+
+        # Welch's t-test on the aggregated arrays, one value per feature
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stat, dof = _welch_t(mean[0], var[0], count[0],
+                                   mean[1], var[1], count[1])
+        p_vals = 2 * stats.t.sf(np.abs(t_stat), dof)
+        for i, feature in enumerate(numeric_cols):
+            numeric_stats[feature] = (mean[0, i], mean[1, i], p_vals[i])
+
     balance_report = []
+    numeric_plots = []
 
     for feature in confounders:
-        if df_control[feature].dtype in ['int64','float64']:
+        if feature in numeric_stats:
             # Numeric feature
-            mean_a = df_control[feature].mean()
-            mean_b = df_test[feature].mean()
-            t_stat, p_val = stats.ttest_ind(
-                df_control[feature].dropna(),
-                df_test[feature].dropna(),
-                equal_var=False
-            )
+            mean_a, mean_b, p_val = numeric_stats[feature]
             balanced = p_val > 0.05
             balance_report.append({
                 'feature': feature,
@@ -53,13 +87,11 @@ def check_balance(df_control, df_test, confounders, plot=False):
                 'balanced': balanced
             })
 
-            # Plot distribution if requested
+            # Collect distributions; plotted together after the loop
             if plot:
-                sns.kdeplot(df_control[feature].dropna(), label='Control')
-                sns.kdeplot(df_test[feature].dropna(), label='Test')
-                plt.title(f'Distribution of {feature}')
-                plt.legend()
-                plt.show()
+                numeric_plots.append((feature,
+                                      df_control[feature].dropna().to_numpy(),
+                                      df_test[feature].dropna().to_numpy()))
 
         else:
             # Categorical feature
@@ -85,4 +117,17 @@ def check_balance(df_control, df_test, confounders, plot=False):
                 df_concat.plot(kind='bar', figsize=(6,4), title=f'Distribution of {feature}')
                 plt.show()
 
+    # One figure for all numeric features; density histograms are O(N) and
+    # avoid a KDE bandwidth fit per feature
+    if numeric_plots:
+        fig, axes = plt.subplots(len(numeric_plots), 1, squeeze=False,
+                                 figsize=(6, 3 * len(numeric_plots)))
+        for ax, (feature, a, b) in zip(axes[:, 0], numeric_plots):
+            ax.hist(a, bins=64, density=True, alpha=0.5, label='Control')
+            ax.hist(b, bins=64, density=True, alpha=0.5, label='Test')
+            ax.set_title(f'Distribution of {feature}')
+            ax.legend()
+        fig.tight_layout()
+        plt.show()
+
     return pd.DataFrame(balance_report)
@@ -1,8 +1,12 @@
+import numpy as np
 import pandas as pd
 def hypothesis_summary_generator(results_df):
     """
     Generator that yields a summary of hypothesis test results row by row.
 
+    The lines are built column-wise with vectorized string operations and
+    then yielded one at a time.
+
     Parameters
     ----------
     results_df : pd.DataFrame
@@ -14,10 +18,22 @@ def hypothesis_summary_generator(results_df):
     str
         Human-readable summary line for each hypothesis
     """
-    for _, row in results_df.iterrows():
-        if pd.isna(row['p_value']):
-            yield f"Cannot compute test for {row['feature']} on KPI {row['kpi']} ({row.get('description','')})"
-        elif row['reject_null']:
-            yield f"Reject H0 for {row['feature']} on KPI {row['kpi']}: p={row['p_value']:.4f}"
-        else:
-            yield f"Fail to reject H0 for {row['feature']} on KPI {row['kpi']}: p={row['p_value']:.4f}"
+    if results_df.empty:
+        return
+
+    pv = pd.to_numeric(results_df['p_value']).to_numpy(dtype=float)
+    nan_mask = np.isnan(pv)
+    rej = results_df['reject_null'].eq(True).to_numpy()
+    p_str = np.char.mod('%.4f', pv).astype(object)
+
+    target = (" for " + results_df['feature'].astype(str)
+              + " on KPI " + results_df['kpi'].astype(str)).to_numpy(dtype=object)
+    if 'description' in results_df.columns:
+        description = results_df['description'].astype(str).to_numpy(dtype=object)
+    else:
+        description = np.full(len(results_df), '', dtype=object)
+
+    s_nan = "Cannot compute test" + target + " (" + description + ")"
+    s_rej = "Reject H0" + target + ": p=" + p_str
+    s_fail = "Fail to reject H0" + target + ": p=" + p_str
+    yield from np.where(nan_mask, s_nan, np.where(rej, s_rej, s_fail)).tolist()
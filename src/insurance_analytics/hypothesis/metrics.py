@@ -17,13 +17,14 @@ def _require_columns(df: pd.DataFrame, cols: list[str]) -> None:
 def claim_frequency(df: pd.DataFrame) -> pd.Series:
     """
     Compute claim frequency flag per policy.
-    Returns a Series of 0/1 integers (1 = at least one claim).
+    Returns a Series of 0/1 int8 values (1 = at least one claim).
     """
     _require_columns(df, ["TotalClaims"])
-    # Treat missing TotalClaims as 0 (no claim) unless you prefer to keep NaN
-    freq = (df["TotalClaims"].fillna(0) > 0).astype(int)
-    freq.name = "ClaimFrequency"
-    return freq
+    # Missing TotalClaims count as no claim: NaN > 0 is False, so a single
+    # comparison on the raw array is enough (no fillna / cast passes)
+    tc = df["TotalClaims"].to_numpy(dtype=float)
+    freq = (tc > 0).view(np.int8)
+    return pd.Series(freq, index=df.index, name="ClaimFrequency", copy=False)
 
 
 def claim_severity(df: pd.DataFrame, keep_na: bool = True) -> pd.Series:
@@ -36,14 +37,10 @@ def claim_severity(df: pd.DataFrame, keep_na: bool = True) -> pd.Series:
     Returned Series aligns with df.index.
     """
     _require_columns(df, ["TotalClaims"])
-    total_claims = df["TotalClaims"]
-    # Create series filled with NaN then set positive claims
-    severity = pd.Series(np.nan, index=df.index, name="ClaimSeverity")
-    positive_mask = total_claims.notna() & (total_claims > 0)
-    severity.loc[positive_mask] = total_claims.loc[positive_mask].astype(float)
-    if not keep_na:
-        severity = severity.fillna(0.0)
-    return severity
+    tc = df["TotalClaims"].to_numpy(dtype=np.float64, na_value=np.nan)
+    # NaN > 0 is False, so missing claims fall through to the fill value
+    severity = np.where(tc > 0, tc, np.nan if keep_na else 0.0)
+    return pd.Series(severity, index=df.index, name="ClaimSeverity", copy=False)
 
 
 def margin(df: pd.DataFrame, fillna: Optional[float] = None) -> pd.Series:
@@ -85,6 +82,46 @@ def margin_rate(df: pd.DataFrame, eps: float = 1e-9) -> pd.Series:
     return rate
 
 
+def margin_and_rate(df: pd.DataFrame, eps: float = 1e-9) -> tuple[pd.Series, pd.Series]:
+    """
+    Compute Margin and MarginRate together from one read of the premium and
+    claim columns. Same results as margin(df) and margin_rate(df, eps).
+
+    Returns (margin, margin_rate) Series aligned to df.index.
+    """
+    _require_columns(df, ["TotalPremium", "TotalClaims"])
+    tp = df["TotalPremium"].to_numpy(dtype=float)
+    tc = df["TotalClaims"].to_numpy(dtype=float)
+    m = tp - tc
+    # treat too-small premiums as NaN to avoid huge/inf rates
+    safe = np.abs(tp) > eps
+    rate = np.where(safe, m / np.where(safe, tp, 1.0), np.nan)
+    return (pd.Series(m, index=df.index, name="Margin", copy=False),
+            pd.Series(rate, index=df.index, name="MarginRate", copy=False))
+
+
+def attach_metrics_fast(df: pd.DataFrame, eps: float = 1e-9) -> pd.DataFrame:
+    """
+    Default-path attach_metrics: ClaimFrequency, ClaimSeverity (NaN for
+    non-claims), Margin and MarginRate without any fillna.
+
+    TotalPremium and TotalClaims are read once as ndarrays and all four
+    columns are added in a single assign; the input df is not modified.
+    """
+    _require_columns(df, ["TotalPremium", "TotalClaims"])
+    tp = df["TotalPremium"].to_numpy(dtype=float)
+    tc = df["TotalClaims"].to_numpy(dtype=float)
+    has_claim = tc > 0
+    m = tp - tc
+    safe = np.abs(tp) > eps
+    return df.assign(
+        ClaimFrequency=has_claim.view(np.int8),
+        ClaimSeverity=np.where(has_claim, tc, np.nan),
+        Margin=m,
+        MarginRate=np.where(safe, m / np.where(safe, tp, 1.0), np.nan),
+    )
+
+
 def attach_metrics(
     df: pd.DataFrame,
     *,
@@ -104,15 +141,22 @@ def attach_metrics(
 
     Returns the DataFrame with new columns added, aligned to the original index.
     """
+    if (keep_severity_na and fillna_for_margin is None
+            and include_margin_rate and not inplace):
+        return attach_metrics_fast(df)
+
     if not inplace:
         df = df.copy()
 
     try:
         df["ClaimFrequency"] = claim_frequency(df)
         df["ClaimSeverity"] = claim_severity(df, keep_na=keep_severity_na)
-        df["Margin"] = margin(df, fillna=fillna_for_margin)
-        if include_margin_rate:
-            df["MarginRate"] = margin_rate(df)
+        if include_margin_rate and fillna_for_margin is None:
+            df["Margin"], df["MarginRate"] = margin_and_rate(df)
+        else:
+            df["Margin"] = margin(df, fillna=fillna_for_margin)
+            if include_margin_rate:
+                df["MarginRate"] = margin_rate(df)
     except Exception as exc:
         logger.exception("Error attaching metrics: %s", exc)
         raise
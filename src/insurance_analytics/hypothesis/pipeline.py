@@ -1,5 +1,6 @@
 # src/insurance_analytics/hypothesis/pipeline.py
 
+import json
 import pandas as pd
 from pathlib import Path
 
@@ -11,6 +12,14 @@ from insurance_analytics.hypothesis.statistical_tests import (
 )
 from insurance_analytics.hypothesis.assumption_checks import evaluate_hypothesis
 
+try:  # faster JSON writer with native numpy support
+    import orjson
+except ImportError:
+    orjson = None
+
+# Only these columns are read by the A/B tests below
+AB_TEST_COLUMNS = ["Province", "PostalCode", "Gender", "TotalClaims", "TotalPremium"]
+
 
 def run_ab_tests(df: pd.DataFrame):
     """
@@ -18,7 +27,8 @@ def run_ab_tests(df: pd.DataFrame):
     Returns a dictionary of results.
     """
     try:
-        df = attach_metrics(df)
+        # Narrow to the tested columns once so every segment filter is cheap
+        df = attach_metrics(df[AB_TEST_COLUMNS])
         results = {}
 
         # ---- 1. Province ----
@@ -67,9 +77,17 @@ def save_results(results: dict, output_dir: Path):
         output_dir.mkdir(parents=True, exist_ok=True)
         out_path = output_dir / "ab_test_results.json"
 
-        import json
-        with open(out_path, "w") as f:
-            json.dump(results, f, indent=4)
+        if orjson is not None:
+            payload = orjson.dumps(
+                results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            payload = json.dumps(
+                results, indent=4,
+                default=lambda o: o.item() if hasattr(o, "item") else str(o)
+            ).encode("utf-8")
+        with open(out_path, "wb") as f:
+            f.write(payload)
 
         print(f"A/B testing results saved at: {out_path}")
         return out_path
@@ -12,7 +12,7 @@ def split_control_test(
     feature: str,
     group_a_values: Union[List, str, int],
     group_b_values: Union[List, str, int],
-    copy: bool = True
+    copy: bool = False
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Split dataframe into Control (A) and Test (B) based on values of a feature.
@@ -22,10 +22,12 @@ def split_control_test(
         feature: column name used for segmentation.
         group_a_values: value(s) in feature for Control group.
         group_b_values: value(s) in feature for Test group.
-        copy: if True, return copies; else return views.
+        copy: if True, return independent copies. Defaults to False, since the
+            balance checks and tests downstream only read the groups.
 
     Returns:
-        df_a, df_b: Control and Test dataframes.
+        df_a, df_b: Control and Test dataframes. Treat them as read-only
+        unless copy=True.
     """
     if feature not in df.columns:
         raise ValueError(f"Feature '{feature}' not found in DataFrame")
@@ -74,37 +76,49 @@ def check_balance(
         confounders = [c for c in df_a.columns if c not in [
             "ClaimIndicator", "ClaimSeverity", "Margin", "MarginRate", "PolicyID"]]
 
+    numeric_cols = df_a[confounders].select_dtypes(include=["number", "bool"]).columns
+    cat_cols = [c for c in confounders if c not in numeric_cols]
+
+    # numeric: one mean() per group covers every column
+    means_a = df_a[numeric_cols].mean()
+    means_b = df_b[numeric_cols].mean()
+
+    # categorical: stack both groups once and get per-group proportions
+    props = {}
+    if cat_cols:
+        stacked = pd.concat(
+            [df_a[cat_cols].assign(_g=0), df_b[cat_cols].assign(_g=1)],
+            ignore_index=True,
+        )
+        grouped = stacked.groupby("_g")
+        for col in cat_cols:
+            props[col] = (grouped[col].value_counts(normalize=True, dropna=False)
+                          .unstack("_g", fill_value=0)
+                          .reindex(columns=[0, 1], fill_value=0))
+
     summary = []
     for col in confounders:
-        if pd.api.types.is_numeric_dtype(df_a[col]):
-            val_a = df_a[col].mean()
-            val_b = df_b[col].mean()
-            diff = val_b - val_a
+        if col in props:
+            prop = props[col]
+            diff = prop[1] - prop[0]
+            summary.extend({
+                "feature": col,
+                "type": "categorical",
+                "value_a": p_a,
+                "value_b": p_b,
+                "difference": d,
+                "imbalanced": abs(d) > threshold
+            } for p_a, p_b, d in zip(prop[0], prop[1], diff))
+        else:
+            diff = means_b[col] - means_a[col]
             summary.append({
                 "feature": col,
                 "type": "numeric",
-                "value_a": val_a,
-                "value_b": val_b,
+                "value_a": means_a[col],
+                "value_b": means_b[col],
                 "difference": diff,
                 "imbalanced": abs(diff) > threshold
             })
-        else:
-            # categorical: compare proportion of each category
-            prop_a = df_a[col].value_counts(normalize=True, dropna=False)
-            prop_b = df_b[col].value_counts(normalize=True, dropna=False)
-            all_values = set(prop_a.index).union(prop_b.index)
-            for val in all_values:
-                p_a = prop_a.get(val, 0)
-                p_b = prop_b.get(val, 0)
-                diff = p_b - p_a
-                summary.append({
-                    "feature": col,
-                    "type": "categorical",
-                    "value_a": p_a,
-                    "value_b": p_b,
-                    "difference": diff,
-                    "imbalanced": abs(diff) > threshold
-                })
 
     return pd.DataFrame(summary)
 
@@ -9,6 +9,42 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 
+try:  # optional accelerator, installed with the "fast" extra
+    from numba import get_num_threads, njit, prange
+except ImportError:  # pragma: no cover - numba not installed
+    njit = None
+
+# Row count above which the parallel numba table builder beats np.bincount
+NUMBA_MIN_ROWS = 100_000
+
+
+def _contingency_kernel(a, b, n_a, n_b, n_chunks):
+    # Each chunk fills its own table (no atomic adds), reduced at the end
+    partial = np.zeros((n_chunks, n_a, n_b), np.int64)
+    n = a.size
+    step = (n + n_chunks - 1) // n_chunks
+    for c in prange(n_chunks):
+        for i in range(c * step, min(n, (c + 1) * step)):
+            if a[i] >= 0 and b[i] >= 0:
+                partial[c, a[i], b[i]] += 1
+    return partial.sum(axis=0)
+
+
+if njit is not None:
+    _contingency_kernel = njit(parallel=True, cache=True)(_contingency_kernel)
+
+
+def contingency_table(a: np.ndarray, b: np.ndarray, n_a: int, n_b: int) -> np.ndarray:
+    """
+    Count pairs of integer codes into an ``(n_a, n_b)`` table.
+    Negative codes (missing values from ``pd.factorize``) are skipped.
+    """
+    if njit is not None and a.size > NUMBA_MIN_ROWS:
+        return _contingency_kernel(a, b, n_a, n_b, get_num_threads())
+    valid = (a >= 0) & (b >= 0)
+    return np.bincount(a[valid] * n_b + b[valid],
+                       minlength=n_a * n_b).reshape(n_a, n_b)
+
 
 def chi2_test_categorical(df: pd.DataFrame, feature: str, kpi: str = "ClaimFrequency") -> Tuple[float, float]:
     """
@@ -17,11 +53,28 @@ def chi2_test_categorical(df: pd.DataFrame, feature: str, kpi: str = "ClaimFrequ
     Returns:
         chi2_statistic, p_value
     """
-    contingency = pd.crosstab(df[feature], df[kpi])
-    chi2, p, dof, expected = stats.chi2_contingency(contingency)
+    # Contingency table from factorized codes instead of the groupby-size
+    # behind pd.crosstab
+    a, a_levels = pd.factorize(df[feature])
+    b, b_levels = pd.factorize(df[kpi])
+    table = contingency_table(a, b, len(a_levels), len(b_levels))
+    # like crosstab, drop levels that only occur alongside missing values
+    table = table[table.any(axis=1)][:, table.any(axis=0)]
+    chi2, p, dof, expected = stats.chi2_contingency(table)
     return chi2, p
 
 
+def _two_level_codes(df: pd.DataFrame, feature: str) -> np.ndarray:
+    """Integer codes (0, 1, -1 for missing) of a feature that must have 2 levels."""
+    # The uniques from factorize give the level count, so no separate
+    # nunique()/unique() pass is needed for the guard
+    codes, levels = pd.factorize(df[feature], sort=False)
+    if len(levels) != 2:
+        raise ValueError(
+            f"T-test requires exactly 2 groups; found {len(levels)} in feature '{feature}'")
+    return codes
+
+
 def t_test_numeric(df: pd.DataFrame, feature: str, kpi: str) -> Tuple[float, float]:
     """
     Two-sample t-test for numeric KPI across two groups defined by a binary/categorical feature.
@@ -30,18 +83,39 @@ def t_test_numeric(df: pd.DataFrame, feature: str, kpi: str) -> Tuple[float, flo
     Returns:
         t_statistic, p_value
     """
-    levels = df[feature].dropna().unique()
-    if len(levels) != 2:
-        raise ValueError(
-            f"T-test requires exactly 2 groups; found {len(levels)} in feature '{feature}'")
+    # one factorize pass instead of a comparison mask per level
+    codes = _two_level_codes(df, feature)
+    values = df[kpi].to_numpy(dtype=float)
+    valid = ~np.isnan(values)
 
-    g1 = df[df[feature] == levels[0]][kpi].dropna()
-    g2 = df[df[feature] == levels[1]][kpi].dropna()
+    g1 = values[(codes == 0) & valid]
+    g2 = values[(codes == 1) & valid]
 
     t_stat, p_value = stats.ttest_ind(g1, g2, equal_var=False)
     return t_stat, p_value
 
 
+def t_test_numeric_batch(df: pd.DataFrame, feature: str, kpis: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Welch t-tests for several numeric KPIs across the same two feature levels.
+
+    The KPI columns of each group are stacked into a 2-D array and tested in
+    a single ``stats.ttest_ind`` call; NaNs are omitted per KPI, as with
+    :func:`t_test_numeric`.
+
+    Returns:
+        t_statistics, p_values (one entry per KPI, in ``kpis`` order)
+    """
+    codes = _two_level_codes(df, feature)
+    values = df[kpis].to_numpy(dtype=float)
+
+    a = values[codes == 0].T
+    b = values[codes == 1].T
+
+    t_stat, p_value = stats.ttest_ind(a, b, axis=1, equal_var=False, nan_policy="omit")
+    return np.asarray(t_stat), np.asarray(p_value)
+
+
 def anova_numeric(df: pd.DataFrame, feature: str, kpi: str) -> Tuple[float, float]:
     """
     One-way ANOVA for numeric KPI across multiple levels of a categorical feature.
@@ -81,13 +155,30 @@ def run_hypothesis_tests(df: pd.DataFrame, hypotheses: Optional[List[dict]] = No
                 "test_type": "chi2", "description": "Risk differences by gender"}
         ]
 
+    # Batch t-tests that share a grouping feature into one SciPy call
+    t_kpis = {}
+    for h in hypotheses:
+        if h.get("test_type") == "t":
+            kpis = t_kpis.setdefault(h.get("feature"), [])
+            if h.get("kpi") not in kpis:
+                kpis.append(h.get("kpi"))
+    t_results = {}
+    for feature, kpis in t_kpis.items():
+        try:
+            t_stat, p_value = t_test_numeric_batch(df, feature, kpis)
+        except Exception:
+            continue  # per-hypothesis fallback below reports the error
+        for kpi, stat, p in zip(kpis, t_stat.tolist(), p_value.tolist()):
+            t_results[(feature, kpi)] = (stat, p)
+
     results = []
     for h in hypotheses:
         try:
             if h["test_type"] == "chi2":
                 stat, p = chi2_test_categorical(df, h["feature"], h["kpi"])
             elif h["test_type"] == "t":
-                stat, p = t_test_numeric(df, h["feature"], h["kpi"])
+                stat, p = t_results.get((h["feature"], h["kpi"])) or t_test_numeric(
+                    df, h["feature"], h["kpi"])
             elif h["test_type"] == "anova":
                 stat, p = anova_numeric(df, h["feature"], h["kpi"])
             else:
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
@@ -15,33 +17,41 @@ class ModelingDataPrep:
         self.df = df.drop(columns=['PolicyID', 'TransactionMonth', 'VehicleIntroDate'], errors='ignore')
         
         # Convert non-numeric types to 'object' to ensure they are handled by the OneHotEncoder later, not the StandardScaler.
-        for col in self.df.columns:
-            if self.df[col].dtype != np.number:
-                self.df[col] = self.df[col].astype('object')
+        # One grouped cast; `dtype != np.number` matched every column, numeric ones included.
+        non_numeric = self.df.select_dtypes(exclude=[np.number]).columns
+        self.df = self.df.astype({col: 'object' for col in non_numeric})
         
         #  DEFINE A MASTER FEATURE LIST (All non-target columns)
         # We explicitly exclude all targets and target-related metrics here.
         self.TARGET_COLS = ['HasClaim', 'TotalClaims'] 
         self.FEATURE_COLS = [col for col in self.df.columns if col not in self.TARGET_COLS]        
 
-    def get_preprocessor(self, X_train: pd.DataFrame) -> ColumnTransformer:
+        # Feature types are fixed after the cast above, so partition them once
+        self._cat_cols = [col for col in self.FEATURE_COLS if col in non_numeric]
+        self._num_cols = [col for col in self.FEATURE_COLS if col not in non_numeric]
+
+    def get_preprocessor(self, X_train: Optional[pd.DataFrame] = None) -> ColumnTransformer:
         """
         Defines the column transformer (preprocessing steps) needed for the modeling pipeline.
         This handles both numerical scaling and categorical encoding simultaneously.
+
+        Feature types are taken from the partition computed in ``__init__``;
+        ``X_train`` is accepted for backward compatibility and ignored.
         """
         
-        # Identify feature types
-        numerical_features = X_train.select_dtypes(exclude='object').columns.tolist()
-        categorical_features = X_train.select_dtypes(include='object').columns.tolist()
+        numerical_features = self._num_cols
+        categorical_features = self._cat_cols
         # Define preprocessing steps:
         preprocessor = ColumnTransformer(
             transformers=[
                 # 1. Scaling for numerical features
                 ('num', StandardScaler(), numerical_features),
                 # 2. One-Hot Encoding for categorical features
-                ('cat', OneHotEncoder(handle_unknown='ignore', sparse_output=True), categorical_features)
+                ('cat', OneHotEncoder(handle_unknown='ignore', sparse_output=True, dtype=np.float32),
+                 categorical_features)
             ],
-            remainder='passthrough'
+            # every feature is listed above, so there is nothing to pass through
+            remainder='drop'
         )
         return preprocessor
 
@@ -55,12 +65,14 @@ class ModelingDataPrep:
         severity_df = self.df[self.df['HasClaim'] == 1].copy()
         
         # Explicitly ensure TotalClaims is a numeric type just before the calculation to resolve the TypeError.
-        severity_df['TotalClaims'] = pd.to_numeric(severity_df['TotalClaims'], errors='coerce')
-        # Handle any remaining NaNs that might have resulted from 'coerce' by filling with 0
-        severity_df['TotalClaims'] = severity_df['TotalClaims'].fillna(0)
+        tc = pd.to_numeric(severity_df['TotalClaims'], errors='coerce').to_numpy(dtype=float)
         
-        # Log-transform the target to normalize its highly skewed distribution
-        severity_df['LogTotalClaims'] = np.log1p(severity_df['TotalClaims'])
+        # Log-transform the target to normalize its highly skewed distribution.
+        # NaNs from 'coerce' count as 0 claims; log1p(0) == 0, so they are zeroed
+        # in place on the freshly allocated log array.
+        log_tc = np.log1p(tc)
+        log_tc[np.isnan(log_tc)] = 0.0
+        severity_df['LogTotalClaims'] = log_tc
         
         
         # Use the MASTER feature list for X
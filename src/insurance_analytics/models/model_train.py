@@ -1,7 +1,10 @@
+import os
 import pandas as pd
 import numpy as np
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Literal, Optional, Tuple, Dict, Any
 
+from joblib import Parallel, delayed
+from threadpoolctl import threadpool_limits
 from sklearn.pipeline import Pipeline
 from sklearn.metrics import mean_squared_error, r2_score, roc_auc_score, f1_score, precision_score, recall_score
 from sklearn.linear_model import LinearRegression, LogisticRegression
@@ -10,29 +13,58 @@ from xgboost import XGBRegressor, XGBClassifier
 from sklearn.compose import ColumnTransformer
 
 # ---- Helpers ----
-def auto_detect_column_types(df: pd.DataFrame, numeric_threshold: float = 0.9
+def auto_detect_column_types(df: pd.DataFrame, numeric_threshold: float = 0.9,
+                             sample_size: int = 20_000
                              ) -> Tuple[List[str], List[str]]:
     """
     Heuristic detection: if a column can be mostly coerced to numeric, treat as numeric.
     Returns (numeric_cols, categorical_cols).
+
+    Columns with a numeric dtype are not coerced; for other columns the
+    numeric fraction is estimated on a sample of ``sample_size`` rows.
     """
     numeric_cols, categorical_cols = [], []
     for c in df.columns:
-        coerced = pd.to_numeric(df[c], errors='coerce')
-        frac_numeric = coerced.notna().mean()
-        # treat small-cardinality numeric-like as categorical (e.g., zipcode-like)
-        if frac_numeric >= numeric_threshold and df[c].nunique() > 10:
+        col = df[c]
+        if pd.api.types.is_numeric_dtype(col):
+            frac_numeric = col.notna().mean()
+        else:
+            sample = col if len(col) <= sample_size else col.sample(sample_size, random_state=0)
+            frac_numeric = pd.to_numeric(sample, errors='coerce').notna().mean()
+        # treat small-cardinality numeric-like as categorical (e.g., zipcode-like);
+        # nunique is only hashed for columns that pass the numeric check
+        if frac_numeric >= numeric_threshold and col.nunique() > 10:
             numeric_cols.append(c)
         else:
             categorical_cols.append(c)
     return numeric_cols, categorical_cols
 
 
-def sanitize_numeric_columns(df: pd.DataFrame, numeric_cols: List[str]) -> pd.DataFrame:
-    df = df.copy()
+def sanitize_numeric_columns(
+    df: pd.DataFrame,
+    numeric_cols: List[str],
+    downcast: bool = True,
+    copy: bool = True
+) -> pd.DataFrame:
+    """
+    Coerce numeric columns, optionally downcasting each to the smallest
+    float (or, for integer-valued columns without NaN, integer) dtype that
+    holds its values. With ``copy=False`` the columns are replaced on `df`
+    itself, so the caller must own the frame.
+    """
+    if copy:
+        df = df.copy()
     for c in numeric_cols:
         if c in df.columns:
-            df[c] = pd.to_numeric(df[c], errors='coerce')
+            if not downcast:
+                df[c] = pd.to_numeric(df[c], errors='coerce')
+                continue
+            s = pd.to_numeric(df[c], errors='coerce', downcast='float')
+            if s.dtype.kind == 'f' and s.notna().all() and (s % 1 == 0).all():
+                # pandas probes narrower int dtypes; overflow in those probes is expected
+                with np.errstate(invalid='ignore'):
+                    s = pd.to_numeric(s, downcast='integer')
+            df[c] = s
     return df
 
 
@@ -40,30 +72,52 @@ def sanitize_categorical_columns(
     df: pd.DataFrame,
     categorical_cols: List[str],
     missing_token: str = "MISSING",
-    null_like: Optional[List[str]] = None
+    null_like: Optional[List[str]] = None,
+    copy: bool = True
 ) -> pd.DataFrame:
-    df = df.copy()
+    """
+    Normalize categorical columns to stripped strings with missing and
+    null-like values replaced by `missing_token`. With ``copy=False`` the
+    columns are replaced on `df` itself.
+    """
     if null_like is None:
         null_like = ["nan", "NaN", "None", "NONE", "NA", "N/A", "", " "]
+    null_like_set = frozenset(null_like)
+
+    cols = [c for c in categorical_cols if c in df.columns]
+    if not cols:
+        return df.copy() if copy else df
+
+    # Sanitize the whole categorical block at once on Arrow-backed strings:
+    # null-like strings -> NA, strip whitespace, fill missing with the token.
+    # The cast also covers mixed-type columns, and .str.strip on this dtype
+    # runs Arrow's utf8_trim_whitespace kernel with native null handling.
+    # Null-like matching stays before the strip, as in the original loop.
+    cats = df[cols].astype("string[pyarrow]")
+    cats = cats.mask(cats.isin(null_like_set))
+    cats = cats.apply(lambda s: s.str.strip())
+    cats = cats.fillna(missing_token)
+
+    # shallow copy: the caller's frame is left untouched, untouched columns are shared
+    out = df.copy(deep=False) if copy else df
+    out[cols] = cats.astype(str)
+    return out
+
+
+def _fit_estimator(name: str, model: Any, X: Any, y: pd.Series) -> Tuple[str, Any]:
+    # runs in a loky worker next to the other fits: native thread pools (BLAS,
+    # OpenMP) get one thread, only the model's own n_jobs is parallel
+    with threadpool_limits(1):
+        model.fit(X, y)
+    return name, model
 
-    for c in categorical_cols:
-        if c not in df.columns:
-            continue
-        # replace common null-like strings with np.nan
-        df[c] = df[c].replace(to_replace=null_like, value=np.nan)
-        # strip whitespace for strings (safe even if mixed types)
-        try:
-            # convert to string only after handling NaN to avoid "nan" strings
-            df[c] = df[c].where(df[c].notna(), other=np.nan)
-            # For non-null values, convert to str and strip
-            df.loc[df[c].notna(), c] = df.loc[df[c].notna(), c].astype(str).str.strip()
-        except Exception:
-            # fallback: cast entire column to str then strip (less ideal)
-            df[c] = df[c].astype(str).str.strip()
-            df[c] = df[c].replace(to_replace=null_like, value=np.nan)
-        # fill missing with token and ensure uniform string dtype
-        df[c] = df[c].fillna(missing_token).astype(str)
-    return df
+
+def _cap_n_jobs(model: Any, n_jobs: int) -> Any:
+    """Lower an estimator's n_jobs (-1 or larger than `n_jobs`) to `n_jobs`."""
+    current = model.get_params().get("n_jobs") if hasattr(model, "get_params") else None
+    if current is not None and (current < 0 or current > n_jobs):
+        model.set_params(n_jobs=n_jobs)
+    return model
 
 
 # ---- Main Trainer ----
@@ -81,18 +135,27 @@ class ModelTrainer:
         numeric_cols: Optional[List[str]] = None,
         categorical_cols: Optional[List[str]] = None,
         target_transform: Optional[str] = None,
+        device: str = "cpu",
+        dtype_policy: Literal["float32", "float64"] = "float32",
     ):
         """
         :param preprocessor: ColumnTransformer that expects numeric & categorical arrays.
         :param numeric_cols: Optional list of numeric column names. If None, auto-detection is used.
         :param categorical_cols: Optional list of categorical column names. If None, auto-detection is used.
         :param target_transform: 'log' to apply np.log1p to regression y during fit; None otherwise.
+        :param device: XGBoost device, e.g. 'cuda' to train the XGBoost models on a GPU.
+        :param dtype_policy: 'float32' casts float numeric columns to float32 before the preprocessor;
+            'float64' keeps the coerced dtypes.
         """
         self.preprocessor = preprocessor
         self.models: Dict[str, Pipeline] = {}
+        # score kind per classifier ('proba' / 'decision' / 'labels'), probed once after fit
+        self._proba_kind: Dict[str, str] = {}
         self.numeric_cols = numeric_cols
         self.categorical_cols = categorical_cols
         self.target_transform = target_transform
+        self.device = device
+        self.dtype_policy = dtype_policy
 
     # ------------------------
     # Internal helpers
@@ -111,8 +174,18 @@ class ModelTrainer:
             numeric_cols = self.numeric_cols
             categorical_cols = self.categorical_cols
 
-        Xc = sanitize_numeric_columns(X, numeric_cols)
-        Xc = sanitize_categorical_columns(Xc, categorical_cols)
+        # The only copy site: the sanitizers below just replace columns on
+        # this local frame, so a shallow copy keeps the caller's X intact
+        Xc = X.copy(deep=False)
+        Xc = sanitize_numeric_columns(Xc, numeric_cols, copy=False)
+        Xc = sanitize_categorical_columns(Xc, categorical_cols, copy=False)
+        if self.dtype_policy == "float32":
+            # floats only: integer IDs/codes above 2**24 would lose exactness,
+            # and the sanitizer has already downcast them
+            present = [c for c in numeric_cols if c in Xc.columns]
+            floats = Xc[present].select_dtypes("floating").columns
+            if len(floats):
+                Xc[floats] = Xc[floats].astype("float32")
         return Xc
 
     def _safe_target_transform(self, y: pd.Series, inverse: bool = False) -> pd.Series:
@@ -125,37 +198,81 @@ class ModelTrainer:
                 return np.log1p(y)
         return y
 
-    def _safe_predict_proba_values(self, model: Pipeline, X: pd.DataFrame) -> np.ndarray:
+    def _cast_encoded(self, X_enc: Any) -> Any:
         """
-        Return probability for positive class. If predict_proba unavailable, try decision_function,
-        otherwise return predicted labels (not ideal but prevents crash).
+        Cast the encoded matrix (dense or sparse) to float32 under the float32
+        dtype policy, so the estimators train and predict in single precision.
         """
-        try:
-            probs = model.predict_proba(X)
-            if probs.ndim == 2 and probs.shape[1] >= 2:
-                return probs[:, 1]
-            # if single-column probability returned (like for some libs), return it
-            if probs.ndim == 1:
-                return probs
-        except Exception:
-            pass
+        if self.dtype_policy == "float32" and X_enc.dtype != np.float32:
+            return X_enc.astype(np.float32)
+        return X_enc
 
-        # fallback: try decision_function
-        try:
-            df = model.decision_function(X)
-            # scale to 0-1 using logistic in case it's raw scores
-            probs = 1 / (1 + np.exp(-df))
-            return probs
-        except Exception:
-            pass
-
-        # last fallback: predicted labels
+    def _split_encoded(self, model: Pipeline, X_safe: pd.DataFrame, cache: Dict[int, Any]) -> Tuple[Any, Any]:
+        """
+        Return (estimator, encoded X) for a trained pipeline. Pipelines share the
+        fitted preprocessor, so each distinct preprocessor transforms X once.
+        """
+        preprocessor = model.named_steps["preprocessor"]
+        key = id(preprocessor)
+        if key not in cache:
+            cache[key] = self._cast_encoded(preprocessor.transform(X_safe))
+        return model.named_steps["model"], cache[key]
+
+    @staticmethod
+    def _probe_proba_kind(model: Any) -> str:
+        """
+        Classify how a (pipeline or bare) classifier yields scores:
+        'proba', 'decision' or 'labels'.
+        """
+        estimator = model.named_steps["model"] if isinstance(model, Pipeline) else model
+        if hasattr(estimator, "predict_proba"):
+            return "proba"
+        if hasattr(estimator, "decision_function"):
+            return "decision"
+        return "labels"
+
+    def _safe_predict_proba_values(self, model: Any, X: Any, kind: Optional[str] = None) -> np.ndarray:
+        """
+        Return probability for positive class. If predict_proba unavailable, use decision_function,
+        otherwise return predicted labels (not ideal but prevents crash).
+        `kind` is the cached result of _probe_proba_kind; it is probed when omitted.
+        """
+        if kind is None:
+            kind = self._probe_proba_kind(model)
         try:
-            preds = model.predict(X)
-            return preds.astype(float)
+            if kind == "proba":
+                probs = model.predict_proba(X)
+                # single-column probabilities (like for some libs) are returned as-is
+                return probs[:, 1] if probs.ndim == 2 and probs.shape[1] >= 2 else probs.ravel()
+            if kind == "decision":
+                # scale to 0-1 using logistic in case it's raw scores
+                return 1 / (1 + np.exp(-model.decision_function(X)))
+            return model.predict(X).astype(float)
         except Exception:
             # return zeros to avoid crash; caller should handle suspicious metrics
-            return np.zeros(len(X), dtype=float)
+            return np.zeros(X.shape[0], dtype=float)
+
+    def _fit_models(self, model_defs: Dict[str, Any], X: pd.DataFrame, y: pd.Series, tag: str) -> None:
+        """
+        Fit the preprocessor once, then fit every model concurrently (one loky
+        worker per model) on the shared encoded matrix. The cores are split
+        between the workers: each model's n_jobs is capped at
+        cpu_count // n_workers, so workers x threads never exceeds the
+        machine. Each fitted model is stored as a Pipeline with the
+        already-fitted preprocessor, in model_defs order.
+        """
+        X_enc = self._cast_encoded(self.preprocessor.fit_transform(X, y))
+        for name in model_defs:
+            print(f"[{tag}] fitting {name} ...")
+        n_cpus = os.cpu_count() or 1
+        n_workers = min(len(model_defs), n_cpus)
+        inner_jobs = max(1, n_cpus // n_workers)
+        fitted = Parallel(n_jobs=n_workers, backend="loky")(
+            delayed(_fit_estimator)(name, _cap_n_jobs(model, inner_jobs), X_enc, y)
+            for name, model in model_defs.items()
+        )
+        for name, model in fitted:
+            self.models[name] = Pipeline(steps=[("preprocessor", self.preprocessor), ("model", model)])
 
     # ------------------------
     # Training / Evaluation APIs
@@ -171,14 +288,12 @@ class ModelTrainer:
         model_defs: Dict[str, Any] = {
             "Linear_Regression": LinearRegression(),
             "RandomForest_Regressor": RandomForestRegressor(random_state=42, n_jobs=-1, max_depth=10),
-            "XGBoost_Regressor": XGBRegressor(random_state=42, n_jobs=-1, objective="reg:squarederror"),
+            "XGBoost_Regressor": XGBRegressor(random_state=42, n_jobs=-1, objective="reg:squarederror",
+                                              tree_method="hist", grow_policy="lossguide", max_bin=256,
+                                              device=self.device),
         }
 
-        for name, model in model_defs.items():
-            pipeline = Pipeline(steps=[("preprocessor", self.preprocessor), ("model", model)])
-            print(f"[train_regression] fitting {name} ...")
-            pipeline.fit(X_train_safe, y_train_safe)
-            self.models[name] = pipeline
+        self._fit_models(model_defs, X_train_safe, y_train_safe, "train_regression")
         print("[train_regression] done. Models:", list(self.models.keys()))
 
     def evaluate_regression(self, X_test: pd.DataFrame, y_test_orig: pd.Series) -> pd.DataFrame:
@@ -187,10 +302,12 @@ class ModelTrainer:
         before metric calculation.
         """
         X_test_safe = self._prepare_X(X_test)
+        encoded: Dict[int, Any] = {}
         metrics = []
         for name, model in self.models.items():
             try:
-                y_pred_model = model.predict(X_test_safe)
+                estimator, X_enc = self._split_encoded(model, X_test_safe, encoded)
+                y_pred_model = estimator.predict(X_enc)
             except Exception as e:
                 print(f"[evaluate_regression] model {name} predict failed: {e}")
                 continue
@@ -222,16 +339,16 @@ class ModelTrainer:
         y_train_safe = y_train  # assume categorical labels already encoded 0/1
 
         model_defs: Dict[str, Any] = {
-            "Logistic_Regression": LogisticRegression(random_state=42, solver="liblinear"),
+            "Logistic_Regression": LogisticRegression(random_state=42, solver="lbfgs", max_iter=1000),
             "RandomForest_Classifier": RandomForestClassifier(random_state=42, n_jobs=-1, max_depth=10),
-            "XGBoost_Classifier": XGBClassifier(random_state=42, n_jobs=-1, use_label_encoder=False, eval_metric="logloss"),
+            "XGBoost_Classifier": XGBClassifier(random_state=42, n_jobs=-1, use_label_encoder=False, eval_metric="logloss",
+                                                tree_method="hist", grow_policy="lossguide", max_bin=256,
+                                                device=self.device),
         }
 
-        for name, model in model_defs.items():
-            pipeline = Pipeline(steps=[("preprocessor", self.preprocessor), ("model", model)])
-            print(f"[train_classification] fitting {name} ...")
-            pipeline.fit(X_train_safe, y_train_safe)
-            self.models[name] = pipeline
+        self._fit_models(model_defs, X_train_safe, y_train_safe, "train_classification")
+        for name in model_defs:
+            self._proba_kind[name] = self._probe_proba_kind(self.models[name])
         print("[train_classification] done. Models:", list(self.models.keys()))
 
     def evaluate_classification(self, X_test: pd.DataFrame, y_test: pd.Series) -> pd.DataFrame:
@@ -240,11 +357,13 @@ class ModelTrainer:
         Uses predict_proba when available; falls back to sensible alternatives.
         """
         X_test_safe = self._prepare_X(X_test)
+        encoded: Dict[int, Any] = {}
         metrics = []
         for name, model in self.models.items():
             try:
-                y_proba = self._safe_predict_proba_values(model, X_test_safe)
-                y_pred = model.predict(X_test_safe)
+                estimator, X_enc = self._split_encoded(model, X_test_safe, encoded)
+                y_proba = self._safe_predict_proba_values(estimator, X_enc, self._proba_kind.get(name))
+                y_pred = estimator.predict(X_enc)
             except Exception as e:
                 print(f"[evaluate_classification] model {name} predict failed: {e}")
                 continue
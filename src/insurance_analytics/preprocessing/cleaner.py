@@ -11,16 +11,33 @@ import re
 def clean_strings(df: pd.DataFrame) -> pd.DataFrame:
     """
     Trim whitespace, normalize empty values, and clean string anomalies.
-    """
-    str_cols = df.select_dtypes(include="object").columns
-
-    df[str_cols] = df[str_cols].apply(lambda col: col.str.strip())
-
-    df.replace({"": np.nan, " ": np.nan}, inplace=True)
-
-    # Replace weird zero strings (your custom rule)
-    df.replace({".000000000000": 0}, inplace=True)
 
+    String columns are converted to Arrow-backed ``string[pyarrow]`` so the
+    strip runs in Arrow's native kernels; empty strings become missing and
+    the weird zero strings become "0" in the same pass. Each column is then
+    cast back to its original dtype, so later ``select_dtypes`` and
+    ``to_numeric`` calls see the same dtypes as before cleaning.
+    """
+    str_cols = df.select_dtypes(include=["object", "string"]).columns
+    if len(str_cols) == 0:
+        return df
+
+    original_dtypes = df[str_cols].dtypes
+    block = df[str_cols].astype("string[pyarrow]")
+    block = block.apply(lambda col: col.str.strip())
+    # comparisons against <NA> yield <NA>, so fill the masks with False
+    block = block.mask(block.eq("").fillna(False), pd.NA)
+
+    # Replace weird zero strings (your custom rule); fix_numeric parses "0"
+    block = block.mask(block.eq(".000000000000").fillna(False), "0")
+
+    # object columns get NaN back rather than pd.NA, like the raw frame had
+    for col, dtype in original_dtypes.items():
+        if dtype == object:
+            df[col] = pd.Series(block[col].to_numpy(dtype=object, na_value=np.nan),
+                                index=df.index, dtype=object)
+        else:
+            df[col] = block[col].astype(dtype)
     return df
 
 
@@ -47,12 +64,30 @@ def fix_dates(df: pd.DataFrame, date_cols=None) -> pd.DataFrame:
 # -------------------------------------------------------------
 # 3) NUMERIC FIXING
 # -------------------------------------------------------------
-def fix_numeric(df: pd.DataFrame) -> pd.DataFrame:
+def fix_numeric(
+    df: pd.DataFrame,
+    sample_size: int = 1000,
+    min_numeric_frac: float = 0.95
+) -> pd.DataFrame:
     """
     Convert numeric-like columns to numeric when possible.
+
+    Only object/string columns are considered. A column is converted when
+    at least `min_numeric_frac` of a sample of its non-null values parses as
+    numbers; the conversion is kept only if it loses no more than
+    `1 - min_numeric_frac` of the non-null values.
     """
-    for col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="ignore")
+    for col in df.select_dtypes(include=["object", "string"]).columns:
+        values = df[col]
+        sample = values.dropna().head(sample_size)
+        if sample.empty:
+            continue
+        if pd.to_numeric(sample, errors="coerce").notna().mean() < min_numeric_frac:
+            continue
+
+        coerced = pd.to_numeric(values, errors="coerce")
+        if coerced.notna().sum() >= min_numeric_frac * values.notna().sum():
+            df[col] = coerced
     return df
 
 
@@ -85,7 +120,35 @@ def clean_missing(df: pd.DataFrame, drop_threshold: float = 0.85) -> pd.DataFram
 
 
 # -------------------------------------------------------------
-# 6) FULL CLEANING PIPELINE
+# 6) DTYPE DOWNCASTING
+# -------------------------------------------------------------
+def optimize_dtypes(
+    df: pd.DataFrame,
+    categorize: bool = True,
+    max_unique_ratio: float = 0.5
+) -> pd.DataFrame:
+    """
+    Shrink column dtypes to cut memory for later passes over the data.
+
+    Floats and integers are downcast to the smallest dtype that holds
+    their values. When `categorize` is True, object columns whose unique
+    ratio is below `max_unique_ratio` become `category`.
+    """
+    for col in df.select_dtypes(include="float").columns:
+        df[col] = pd.to_numeric(df[col], downcast="float")
+    for col in df.select_dtypes(include="integer").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+
+    if categorize and len(df):
+        for col in df.select_dtypes(include="object").columns:
+            if df[col].nunique() / len(df) < max_unique_ratio:
+                df[col] = df[col].astype("category")
+
+    return df
+
+
+# -------------------------------------------------------------
+# 7) FULL CLEANING PIPELINE
 # -------------------------------------------------------------
 def cleaning(
     df: pd.DataFrame,
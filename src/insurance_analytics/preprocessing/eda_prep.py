@@ -15,96 +15,76 @@ class DataPreprocessor:
     def __init__(self, df: pd.DataFrame):
         self.df = df.copy()
     
-    def _clean_financial_data(self) -> pd.DataFrame:
+    def _coerce_all(self) -> pd.DataFrame:
         """
-        Converts financial columns to numeric, handling errors and non-standard
-        values like currency symbols.
+        Cleans financial columns, corrects dtypes and imputes missing values in a
+        single rebuild of the frame.
+
+        Every converted column is computed into a dict and the DataFrame is
+        constructed once at the end, instead of writing each column back into
+        self.df one at a time.
         """
-        financial_cols = ['TotalPremium', 'TotalClaims', 'CustomValueEstimate']
-        
-        for col in financial_cols:
-            # Coerce non-numeric values to NaN
-            self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
-        
-        # Note: Negative values in Claims (salvage/recovery) and Premium (refunds) 
+        src = self.df
+        out = {col: src[col] for col in src.columns}
+
+        # 1. Financial columns: coerce non-numeric values (currency symbols etc.) to NaN.
+        # Negative values in Claims (salvage/recovery) and Premium (refunds)
         # are valid in insurance data and are retained for accurate profitability analysis.
-        
-        return self.df
-    
-    def _correct_data_types(self) -> pd.DataFrame:
-        """
-        Corrects dtypes for date, discrete count, and flag columns.
-        """
-        # 1. Date Conversion
-        if 'TransactionMonth' in self.df.columns:
-            self.df['TransactionMonth'] = pd.to_datetime(self.df['TransactionMonth'], errors='coerce')
-        if 'VehicleIntroDate' in self.df.columns:
-            self.df['VehicleIntroDate'] = pd.to_datetime(self.df['VehicleIntroDate'], errors='coerce')
-
-        # 2. Discrete Count Conversion
-        discrete_cols = ['Cylinders', 'NumberOfDoors']
-        for col in discrete_cols:
-            if col in self.df.columns:
-                # Convert to integer, using -1 as a temporary placeholder for NaNs
-                self.df[col] = self.df[col].fillna(-1).astype(int)
-                # Convert to categorical to prevent model from treating them as continuous
-                self.df[col] = self.df[col].astype('category')
-
-        # 3. Categorical Conversion
-        category_cols = ['Province', 'VehicleType', 'Gender', 'MaritalStatus']
-        for col in category_cols:
-            if col in self.df.columns:
-                self.df[col] = self.df[col].astype('category')
-        
-        return self.df
-    
-        # NUMERIC CONVERSION FIX: Re-coerce all financial/age columns to numeric 
-        # to prevent them from being mistaken for high-cardinality strings later.
-        numeric_cols_to_check = ['TotalPremium', 'TotalClaims', 'CustomValueEstimate', 
-                                 'CapitalOutstanding', 'SumInsured', 'CalculatedPremiumPerTerm']
-        
-        for col in numeric_cols_to_check:
-             if col in self.df.columns:
-                # Use to_numeric to force type conversion, coercing any remaining strings to NaN
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+        for col in ['TotalPremium', 'TotalClaims', 'CustomValueEstimate']:
+            if col in out:
+                out[col] = pd.to_numeric(out[col], errors='coerce')
+        # TotalClaims/TotalPremium NaNs are imputed with 0
+        for col in ['TotalClaims', 'TotalPremium']:
+            if col in out:
+                out[col] = out[col].fillna(0)
 
-        return self.df
-      
-    def _handle_missing_values(self) -> pd.DataFrame:
-        """
-        Imputes missing values based on column type and domain knowledge.
-        Note: This method assumes _correct_data_types() has already been run.
-        """
-        # 1. Financial/Claim Columns: Impute TotalClaims/TotalPremium NaNs with 0
-        self.df[['TotalClaims', 'TotalPremium']] = self.df[['TotalClaims', 'TotalPremium']].fillna(0)
-
-        # 2. Flag Columns (Missingness Implies 'No'): Impute NaNs with False
-        flag_cols = ['WrittenOff', 'Rebuilt', 'Converted', 'CrossBorder', 'NewVehicle', 'AlarmImmobiliser']
-        for col in flag_cols:
-            if col in self.df.columns:
-                # Use map for safer bool conversion without downcasting warnings
-                self.df[col] = self.df[col].fillna('No').map({'Yes': True, 'No': False}).astype(bool)
-
-        # 3. Critical Categorical Columns: Ensure categorical dtype, then impute with 'MISSING'
-        critical_cat_cols = ['Province', 'Gender', 'MaritalStatus', 'PostalCode']  
-        for col in critical_cat_cols:
-            if col in self.df.columns:
-                if not pd.api.types.is_categorical_dtype(self.df[col]):
-                    self.df[col] = self.df[col].astype('category')
-                self.df[col] = self.df[col].cat.add_categories('MISSING').fillna('MISSING')
-
-        # 4. CustomValueEstimate (High Missing Rate)
-        if 'CustomValueEstimate' in self.df.columns:
-            self.df['ValueEstimate_MISSING'] = self.df['CustomValueEstimate'].isnull()
-            median_val = self.df['CustomValueEstimate'].median()
-            self.df['CustomValueEstimate'] = self.df['CustomValueEstimate'].fillna(median_val)
-
-        # 5. NumberOfVehiclesInFleet (100% missing — likely individual policies)
-        if 'NumberOfVehiclesInFleet' in self.df.columns:
+        # 2. Date Conversion
+        for col in ['TransactionMonth', 'VehicleIntroDate']:
+            if col in out:
+                out[col] = pd.to_datetime(out[col], errors='coerce')
+
+        # 3. Discrete Count Conversion: -1 as a placeholder for NaNs, then categorical
+        # to prevent model from treating them as continuous
+        for col in ['Cylinders', 'NumberOfDoors']:
+            if col in out:
+                out[col] = out[col].fillna(-1).astype(int).astype('category')
+
+        # 4. Categorical Conversion
+        for col in ['Province', 'VehicleType', 'Gender', 'MaritalStatus']:
+            if col in out:
+                out[col] = out[col].astype('category')
+
+        # 5. Flag Columns (Missingness Implies 'No'): Impute NaNs with False.
+        # One comparison over the whole flag block: only 'No' and missing are False,
+        # matching fillna('No').map({'Yes': True, 'No': False}).astype(bool)
+        flag_cols = [col for col in ['WrittenOff', 'Rebuilt', 'Converted', 'CrossBorder',
+                                     'NewVehicle', 'AlarmImmobiliser'] if col in out]
+        if flag_cols:
+            flags = pd.DataFrame({col: out[col] for col in flag_cols}, copy=False).astype(object)
+            flags = (flags.notna() & flags.ne('No')).astype(bool)
+            out.update(flags.items())
+
+        # 6. Critical Categorical Columns: Ensure categorical dtype, then impute with 'MISSING'
+        critical_cat_cols = [col for col in ['Province', 'Gender', 'MaritalStatus', 'PostalCode'] if col in out]
+        if critical_cat_cols:
+            cats = pd.DataFrame({col: out[col] for col in critical_cat_cols}, copy=False).astype('category')
+            cats = cats.apply(lambda s: s if 'MISSING' in s.cat.categories else s.cat.add_categories('MISSING'))
+            out.update(cats.fillna('MISSING').items())
+
+        # 7. CustomValueEstimate (High Missing Rate)
+        if 'CustomValueEstimate' in out:
+            value_estimate = out['CustomValueEstimate']
+            out['ValueEstimate_MISSING'] = value_estimate.isnull()
+            out['CustomValueEstimate'] = value_estimate.fillna(value_estimate.median())
+
+        # 8. NumberOfVehiclesInFleet (100% missing — likely individual policies)
+        if 'NumberOfVehiclesInFleet' in out:
             # Assume 1 for individuals; create fleet indicator
-            self.df['IsFleetPolicy'] = self.df['NumberOfVehiclesInFleet'].notna()
-            self.df['NumberOfVehiclesInFleet'] = self.df['NumberOfVehiclesInFleet'].fillna(1).astype(int)
+            fleet = out['NumberOfVehiclesInFleet']
+            out['IsFleetPolicy'] = fleet.notna()
+            out['NumberOfVehiclesInFleet'] = fleet.fillna(1).astype(int)
 
+        self.df = pd.DataFrame(out, index=src.index, copy=False)
         return self.df
     
     
@@ -115,31 +95,40 @@ class DataPreprocessor:
         """
         # Target ONLY object columns, excluding any that contain critical numeric data
         # 'ZipCode' or 'PostalCode' (if it's the ID), and 'Model' are the typical culprits.
-        categorical_cols_to_group = []
+        # One factorize pass per object column gives both the distinct count
+        # and the integer codes reused by the remap below
+        categorical_cols_to_group = {}
         for col in self.df.select_dtypes(include='object').columns:
             # We assume any remaining object column is a valid string/categorical feature
-            if self.df[col].nunique() > threshold:
-                categorical_cols_to_group.append(col)
+            codes, categories = pd.factorize(self.df[col], sort=True)
+            if len(categories) > threshold:
+                categorical_cols_to_group[col] = (codes, categories)
 
         if not categorical_cols_to_group:
             print("No high-cardinality object columns found for grouping.")
             return self.df
 
-        print(f"Grouping high-cardinality columns ({len(categorical_cols_to_group)}): {categorical_cols_to_group}")
+        print(f"Grouping high-cardinality columns ({len(categorical_cols_to_group)}): {list(categorical_cols_to_group)}")
         
-        for col in categorical_cols_to_group:
-            value_counts = self.df[col].value_counts()
+        for col, (codes, categories) in categorical_cols_to_group.items():
+            # Counts and the rare-level remap are integer array operations,
+            # strings are never rebuilt
+            counts = np.bincount(codes[codes >= 0], minlength=len(categories))
             
             # Identify categories to keep (must appear >= threshold times)
-            to_keep = value_counts[value_counts >= threshold].index
+            keep = counts >= threshold
+            new_categories = list(categories[keep])
+            if 'Other_Category' in new_categories:
+                other_code = new_categories.index('Other_Category')
+            else:
+                other_code = len(new_categories)
+                new_categories.append('Other_Category')
             
-            # Replace rare categories with 'Other_Category'
-            self.df[col] = np.where(
-                self.df[col].isin(to_keep),
-                self.df[col],
-                'Other_Category'
-            )
-            print(f"  -> Cardinality of '{col}' reduced from {len(value_counts)} to {len(to_keep) + 1} categories.")
+            # Replace rare categories (and missing values, code -1) with 'Other_Category'
+            code_map = np.full(len(categories) + 1, other_code, dtype=np.int32)
+            code_map[:-1][keep] = np.arange(keep.sum(), dtype=np.int32)
+            self.df[col] = pd.Categorical.from_codes(code_map[codes], categories=new_categories)
+            print(f"  -> Cardinality of '{col}' reduced from {len(categories)} to {keep.sum() + 1} categories.")
                 
         return self.df
     
@@ -150,12 +139,16 @@ class DataPreprocessor:
         """
         # 1. Claim Indicator (for Claim Frequency)
         # 1 if TotalClaims > 0, else 0
-        self.df['HasClaim'] = np.where(self.df['TotalClaims'] > 0, 1, 0)
+        self.df['HasClaim'] = (self.df['TotalClaims'].to_numpy(dtype=float) > 0).view(np.int8)
         
         # 2. Vehicle Age (for risk modeling later)
         if 'VehicleIntroDate' in self.df.columns and 'TransactionMonth' in self.df.columns:
-            # Calculate age in years
-            self.df['VehicleAge_Years'] = (self.df['TransactionMonth'] - self.df['VehicleIntroDate']).dt.days / 365.25
+            # Calculate age in years: whole days (floored, like .dt.days) as float32
+            days = (self.df['TransactionMonth'].to_numpy()
+                    - self.df['VehicleIntroDate'].to_numpy()).astype('timedelta64[D]')
+            age = days.astype(np.float32)
+            age[np.isnat(days)] = np.nan
+            self.df['VehicleAge_Years'] = age / np.float32(365.25)
             
         return self.df
     
@@ -164,9 +157,7 @@ class DataPreprocessor:
     def run_pipeline(self) -> pd.DataFrame:
         """Executes all preprocessing steps in sequence."""
         print("Starting Data Preprocessing...")
-        self.df = self._clean_financial_data()
-        self.df = self._correct_data_types()
-        self.df = self._handle_missing_values()
+        self.df = self._coerce_all()
         # Apply SAFE cardinality reduction to remaining categorical columns
         self.df = self._handle_high_cardinality(threshold=100)
         self.df = self._create_eda_features()
@@ -2,7 +2,7 @@
 
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.preprocessing import OneHotEncoder, StandardScaler, TargetEncoder
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 
@@ -36,6 +36,9 @@ def bin_numeric(df: pd.DataFrame, col: str, bins: int = 5):
     """
     Create quantile-based bins for a numeric column.
 
+    Bins are right-closed like ``pd.qcut`` (duplicate edges dropped), but
+    stored as int8 bin codes (0 = lowest); missing values get -1.
+
     Example: Age → Age_bin (5 bins)
     """
     if col not in df.columns:
@@ -44,7 +47,16 @@ def bin_numeric(df: pd.DataFrame, col: str, bins: int = 5):
     if not np.issubdtype(df[col].dtype, np.number):
         return df
 
-    df[f"{col}_bin"] = pd.qcut(df[col], q=bins, duplicates="drop")
+    values = df[col].to_numpy(dtype=float)
+    nan_mask = np.isnan(values)
+    if nan_mask.all():
+        df[f"{col}_bin"] = np.full(len(values), -1, dtype=np.int8)
+        return df
+
+    edges = np.unique(np.nanpercentile(values, np.linspace(0, 100, bins + 1)))
+    codes = np.searchsorted(edges[1:-1], values, side="left").astype(np.int8)
+    codes[nan_mask] = -1
+    df[f"{col}_bin"] = codes
     return df
 
 
@@ -63,18 +75,21 @@ def target_encode(df: pd.DataFrame, col: str, target: str):
     if np.issubdtype(df[target].dtype, np.number) is False:
         return df
 
-    means = df.groupby(col)[target].mean()
-    df[f"{col}_te"] = df[col].map(means)
+    # grouped mean scattered back to rows in one pass, no intermediate .map
+    df[f"{col}_te"] = df.groupby(col, sort=False, observed=True)[target].transform("mean")
     return df
 
 
 # -------------------------------------------------------------
 # 4) ONE-HOT ENCODING PIPELINE (for modeling)
 # -------------------------------------------------------------
-def prepare_preprocessor(df: pd.DataFrame):
+def prepare_preprocessor(df: pd.DataFrame, max_onehot_cardinality: int = 50):
     """
     Automatically build a ColumnTransformer:
-    - OneHotEncoder for categorical
+    - OneHotEncoder for categorical columns with at most
+      `max_onehot_cardinality` distinct values
+    - TargetEncoder for higher-cardinality categorical columns, which keeps
+      them as one dense column each instead of thousands of sparse ones
     - StandardScaler for numeric
     """
 
@@ -82,6 +97,10 @@ def prepare_preprocessor(df: pd.DataFrame):
         include=["int64", "float64"]).columns.tolist()
     categorical_cols = df.select_dtypes(include="object").columns.tolist()
 
+    cardinality = df[categorical_cols].nunique()
+    low_card_cols = cardinality.index[cardinality <= max_onehot_cardinality].tolist()
+    high_card_cols = cardinality.index[cardinality > max_onehot_cardinality].tolist()
+
     numeric_transformer = Pipeline(
         steps=[
             ("scaler", StandardScaler())
@@ -90,14 +109,15 @@ def prepare_preprocessor(df: pd.DataFrame):
 
     categorical_transformer = Pipeline(
         steps=[
-            ("onehot", OneHotEncoder(handle_unknown="ignore"))
+            ("onehot", OneHotEncoder(handle_unknown="ignore", dtype=np.float32))
         ]
     )
 
     preprocessor = ColumnTransformer(
         transformers=[
             ("num", numeric_transformer, numeric_cols),
-            ("cat", categorical_transformer, categorical_cols),
+            ("cat", categorical_transformer, low_card_cols),
+            ("high_cat", TargetEncoder(target_type="auto", smooth="auto"), high_card_cols),
         ]
     )
 
@@ -107,20 +127,29 @@ def prepare_preprocessor(df: pd.DataFrame):
 # -------------------------------------------------------------
 # 5) INTERACTION FEATURES
 # -------------------------------------------------------------
-def add_interactions(df: pd.DataFrame, pairs: list[tuple]):
+def add_interactions(df: pd.DataFrame, pairs: list[tuple], dtype=None):
     """
     Create interaction features through multiplication.
 
+    All products are computed in one NumPy multiply over the stacked left
+    and right column blocks. Pass ``dtype=np.float32`` to compute (and
+    store) them in single precision.
+
     Example:
         pairs = [
             ("EngineCapacity", "VehicleAge"),
             ("TotalPremium", "TotalClaims")
         ]
     """
-    for col1, col2 in pairs:
-        if col1 in df.columns and col2 in df.columns:
-            name = f"{col1}_x_{col2}"
-            df[name] = df[col1] * df[col2]
+    valid = [(col1, col2) for col1, col2 in pairs
+             if col1 in df.columns and col2 in df.columns]
+    if not valid:
+        return df
+
+    left = df[[col1 for col1, _ in valid]].to_numpy(dtype=dtype)
+    right = df[[col2 for _, col2 in valid]].to_numpy(dtype=dtype)
+    names = [f"{col1}_x_{col2}" for col1, col2 in valid]
+    df[names] = np.multiply(left, right)
 
     return df
 
@@ -133,10 +162,12 @@ def remove_low_variance(df: pd.DataFrame, threshold: float = 0.0):
     Drop columns that have zero or near-zero variance.
     """
 
-    low_var_cols = [
-        col for col in df.columns
-        if df[col].nunique() <= 1
-    ]
+    # A column with 2+ distinct values in its first rows can never be
+    # constant, so only the remaining candidates get a full nunique pass
+    head_nunique = df.head(256).nunique()
+    candidates = head_nunique.index[head_nunique <= 1]
+    full_nunique = df[candidates].nunique()
+    low_var_cols = full_nunique.index[full_nunique <= 1].tolist()
 
     df = df.drop(columns=low_var_cols)
 
@@ -151,9 +182,10 @@ def add_loss_ratio(df: pd.DataFrame, claims_col: str = "TotalClaims", premium_co
     """
     Add Loss Ratio column: LossRatio = TotalClaims / TotalPremium.
     Handles zero or missing premiums safely.
+    Returns a new DataFrame; the input is left untouched.
     """
     if claims_col not in df.columns or premium_col not in df.columns:
         return df
 
-    df["LossRatio"] = df[claims_col] / df[premium_col].replace({0: np.nan})
-    return df
+    return df.assign(
+        LossRatio=df[claims_col] / df[premium_col].replace({0: np.nan}))
@@ -4,6 +4,23 @@ Common statistical metrics used across analytics modules.
 
 import numpy as np
 
+try:  # optional accelerator, installed with the "fast" extra
+    import bottleneck as bn
+except ImportError:  # pragma: no cover - bottleneck not installed
+    bn = None
+
+
+def _has_nan(arr):
+    # min() propagates NaN, so one reduction answers the question without
+    # allocating the mask np.nan* builds; other arrays are left to np.nan*
+    if arr.size == 0:
+        return None
+    if arr.dtype.kind in "biu":
+        return False
+    if arr.dtype.kind not in "fc":
+        return None
+    return bool(np.isnan(arr.min()))
+
 
 def safe_mean(values):
     """
@@ -16,7 +33,12 @@ def safe_mean(values):
         float | None: Mean of values.
     """
     try:
-        arr = np.array(values)
+        arr = np.asarray(values)
+        has_nan = _has_nan(arr)
+        if has_nan is False:
+            return float(arr.mean())
+        if has_nan and bn is not None:
+            return float(bn.nanmean(arr))
         return float(np.nanmean(arr))
     except Exception as e:
         print(f"[METRICS] Mean failed: {e}")
@@ -27,6 +49,11 @@ def safe_std(values):
     """
     Compute standard deviation safely.
 
+    Population std (ddof=0) over the non-NaN values, from a single pass of
+    count / sum / sum of squares via ufunc ``where=`` masks, so no filtered
+    copy is built. Values are shifted by the first valid value first, which
+    keeps the E[x^2] - E[x]^2 identity from cancelling catastrophically.
+
     Args:
         values (list | array): Numerical values.
 
@@ -34,14 +61,21 @@ def safe_std(values):
         float | None: Standard deviation.
     """
     try:
-        arr = np.array(values)
-        return float(np.nanstd(arr))
+        arr = np.asarray(values, dtype=np.float64)
+        mask = ~np.isnan(arr)
+        n = np.count_nonzero(mask)
+        if n == 0:
+            return float("nan")
+        d = arr - arr.flat[np.argmax(mask)]
+        s = np.add.reduce(d, where=mask, axis=None)
+        s2 = np.add.reduce(np.square(d, out=d), where=mask, axis=None)
+        return float(np.sqrt(max(s2 / n - (s / n) ** 2, 0.0)))
     except Exception as e:
         print(f"[METRICS] STD failed: {e}")
         return None
 
 
-def calculate_throughput(count, time_sec):
+def calculate_throughput(count: float, time_sec: float):
     """
     Calculate throughput = items / time.
 
@@ -50,12 +84,6 @@ def calculate_throughput(count, time_sec):
         time_sec (float): Time taken in seconds.
 
     Returns:
-        float | None: Throughput result.
+        float | None: Throughput result, or None when time_sec is 0.
     """
-    try:
-        if time_sec == 0:
-            return None
-        return count / time_sec
-    except Exception as e:
-        print(f"[METRICS] Throughput calc failed: {e}")
-        return None
+    return None if time_sec == 0 else count / time_sec
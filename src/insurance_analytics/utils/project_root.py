@@ -1,13 +1,16 @@
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """
     Return the project root by climbing upward until a folder
     containing known project markers is found.
 
     This is safer than hardcoding parent levels and works even
-    if the file structure changes.
+    if the file structure changes. The result is cached: the walk
+    stats several files per parent and __file__ never changes.
     """
     current = Path(__file__).resolve()
 
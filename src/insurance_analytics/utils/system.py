@@ -4,16 +4,25 @@ System resource utilities for CPU, memory, and process inspection.
 
 import psutil
 
+# Prime psutil's CPU counters so the first non-blocking reading is meaningful
+psutil.cpu_percent(interval=None)
 
-def get_cpu_usage():
+
+def get_cpu_usage(interval=None):
     """
     Get CPU usage as a percentage.
 
+    Non-blocking by default: returns usage since the previous call (or since
+    import). Pass `interval` in seconds to block and sample a fixed window.
+
+    Args:
+        interval (float, optional): Sampling window in seconds.
+
     Returns:
         float | None: CPU usage percentage, or None on failure.
     """
     try:
-        return psutil.cpu_percent(interval=1)
+        return psutil.cpu_percent(interval=interval)
     except Exception as e:
         print(f"[SYSTEM] CPU check failed: {e}")
         return None
@@ -42,7 +51,9 @@ def get_process_info():
         list: List of process dictionaries.
     """
     try:
-        return [{"pid": p.pid, "name": p.name()} for p in psutil.process_iter()]
+        # attrs are fetched in one batched read per process, and processes
+        # that exit mid-iteration are skipped by psutil itself
+        return [p.info for p in psutil.process_iter(attrs=["pid", "name"])]
     except Exception as e:
         print(f"[SYSTEM] Process list failed: {e}")
         return []
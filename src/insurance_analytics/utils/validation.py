@@ -9,6 +9,9 @@ REQUIRED_KEYS = {
     "artifacts": ["artifacts_dir"],
 }
 
+# Built once at import; each section is checked with one set difference
+_SCHEMA = tuple((section, frozenset(keys)) for section, keys in REQUIRED_KEYS.items())
+
 
 def validate_config_structure(config: Dict) -> None:
     """
@@ -19,7 +22,7 @@ def validate_config_structure(config: Dict) -> None:
     if not isinstance(config, dict):
         raise ValueError("Config must be a mapping/dictionary.")
 
-    for section, keys in REQUIRED_KEYS.items():
+    for section, keys in _SCHEMA:
         section_data = config.get(section)
         if section_data is None:
             raise ValueError(f"Missing '{section}' section in data.yaml")
@@ -28,6 +31,8 @@ def validate_config_structure(config: Dict) -> None:
             raise ValueError(
                 f"Expected '{section}' section to be a mapping (dict).")
 
-        for key in keys:
-            if key not in section_data:
-                raise ValueError(f"Missing '{section}.{key}' in data.yaml")
+        missing = keys - section_data.keys()
+        if missing:
+            # error path only: report in the declared key order
+            names = ", ".join(f"'{section}.{key}'" for key in REQUIRED_KEYS[section] if key in missing)
+            raise ValueError(f"Missing {names} in data.yaml")
@@ -0,0 +1,20 @@
+# src/insurance_analytics/viz/_dtypes.py
+
+import numpy as np
+import pandas as pd
+
+
+def _to_f32(values):
+    """
+    Downcast float64 plot data to float32; plots never need double precision.
+
+    Accepts an ndarray, Series or DataFrame (float64 columns only) and returns
+    the same kind of object. Anything that is not float64 is returned as is.
+    """
+    if isinstance(values, pd.DataFrame):
+        return values.astype({c: np.float32 for c in values.columns[values.dtypes == np.float64]})
+    if values.dtype != np.float64:
+        return values
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float32, copy=False)
+    return values.astype(np.float32)
@@ -5,8 +5,59 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from insurance_analytics.viz._dtypes import _to_f32
+
 sns.set(style="whitegrid")
 
+def _top_codes(codes: np.ndarray, n_groups: int, top_n: int) -> np.ndarray:
+    # codes of the top_n most frequent groups; ties go to the value seen first,
+    # as with value_counts().nlargest(). The sort is over groups, not rows.
+    valid = codes >= 0
+    counts = np.bincount(codes[valid], minlength=n_groups)
+    if top_n >= n_groups:
+        return np.flatnonzero(counts)
+    first = np.full(n_groups, len(codes))
+    np.minimum.at(first, codes[valid], np.flatnonzero(valid))
+    return np.lexsort((first, -counts))[:top_n]
+
+
+def _top_mask(values: pd.Series, top_n: int) -> np.ndarray:
+    """Boolean row mask keeping the `top_n` most frequent values."""
+    codes, uniques = pd.factorize(values)
+    keep = np.zeros(len(uniques) + 1, dtype=bool)  # trailing slot: NaN (code -1)
+    keep[_top_codes(codes, len(uniques), top_n)] = True
+    return keep[codes]
+
+
+def _group_mean(keys: pd.Series, values: pd.Series, top_n: int = None) -> pd.Series:
+    """
+    Mean of `values` per observed key, like groupby(keys).mean(), computed on
+    integer factor codes with bincount instead of hashing objects per row.
+    """
+    codes, uniques = pd.factorize(keys, sort=True)
+    y = values.to_numpy(dtype=float)
+    valid = (codes >= 0) & ~np.isnan(y)
+    n_groups = len(uniques)
+    sums = np.bincount(codes[valid], weights=y[valid], minlength=n_groups)
+    counts = np.bincount(codes[valid], minlength=n_groups)
+    present = np.bincount(codes[codes >= 0], minlength=n_groups) > 0
+
+    # Limit to top N categories (for large PostalCode sets)
+    if top_n:
+        selected = np.zeros(n_groups, dtype=bool)
+        selected[_top_codes(codes, n_groups, top_n)] = True
+        present &= selected
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums[present] / counts[present]
+    return pd.Series(means, index=pd.Index(uniques[present], name=keys.name), name=values.name)
+
+
+def _freq_table(df: pd.DataFrame, feature: str, top_n: int = None) -> pd.DataFrame:
+    """Mean ClaimFrequency per category of `feature`."""
+    freq = _group_mean(df[feature], df["ClaimFrequency"], top_n).reset_index()
+    return freq.rename(columns={"ClaimFrequency": "Frequency"})
+
 
 # ---------------------------------------------------------
 # 1. Claim Frequency by Feature
@@ -17,19 +68,13 @@ def plot_claim_frequency_by_feature(df: pd.DataFrame, feature: str, top_n: int =
     ClaimFrequency must already exist (0/1 indicator).
     """
 
-    data = df.copy()
-
-    # Limit to top N categories (for large PostalCode sets)
-    if top_n:
-        top_vals = data[feature].value_counts().nlargest(top_n).index
-        data = data[data[feature].isin(top_vals)]
-
-    freq = data.groupby(feature)["ClaimFrequency"].mean().reset_index()
-    freq.rename(columns={"ClaimFrequency": "Frequency"}, inplace=True)
+    freq = _freq_table(df, feature, top_n)
 
+    # Already aggregated: plain bars, no seaborn re-aggregation or bootstrap CI
     plt.figure(figsize=(10, 6))
-    sns.barplot(data=freq, x=feature, y="Frequency")
-    plt.xticks(rotation=45, ha="right")
+    plt.bar(np.arange(len(freq)), freq["Frequency"].to_numpy())
+    plt.xticks(np.arange(len(freq)), freq[feature].astype(str), rotation=45, ha="right")
+    plt.xlabel(feature)
     plt.title(f"Claim Frequency by {feature}")
     plt.ylabel("Claim Frequency")
     plt.tight_layout()
@@ -44,15 +89,17 @@ def plot_claim_severity_box_by_feature(df: pd.DataFrame, feature: str, top_n: in
     Boxplot of Claim Severity (only where TotalClaims > 0).
     """
 
-    data = df[df["TotalClaims"] > 0].copy()
+    # Only the two plotted columns are filtered, so the allocation scales with
+    # the claim rows times two columns rather than the full frame
+    data = df.loc[df["TotalClaims"].to_numpy() > 0, [feature, "ClaimSeverity"]]
+    data = data.assign(ClaimSeverity=_to_f32(data["ClaimSeverity"].to_numpy()))
 
     if data.empty:
         print(f"No severity data available for feature '{feature}'.")
         return
 
     if top_n:
-        top_vals = data[feature].value_counts().nlargest(top_n).index
-        data = data[data[feature].isin(top_vals)]
+        data = data[_top_mask(data[feature], top_n)]
 
     plt.figure(figsize=(10, 6))
     sns.boxplot(data=data, x=feature, y="ClaimSeverity")
@@ -77,15 +124,17 @@ def plot_margin_box_by_feature(df: pd.DataFrame, feature: str, top_n: int = None
     Boxplot of profit margin (TotalPremium - TotalClaims).
     """
 
-    data = df.copy()
-    data["Margin"] = data["TotalPremium"] - data["TotalClaims"]
+    # Only the two plotted columns are materialized, never a copy of df
+    cats = df[feature]
+    margin = pd.Series(_to_f32(df["TotalPremium"].to_numpy() - df["TotalClaims"].to_numpy()),
+                       index=df.index, name="Margin")
 
     if top_n:
-        top_vals = data[feature].value_counts().nlargest(top_n).index
-        data = data[data[feature].isin(top_vals)]
+        mask = _top_mask(cats, top_n)
+        cats, margin = cats[mask], margin[mask]
 
     plt.figure(figsize=(10, 6))
-    sns.boxplot(data=data, x=feature, y="Margin")
+    sns.boxplot(x=cats, y=margin)
     plt.xticks(rotation=45, ha="right")
     plt.title(f"Margin by {feature}")
     plt.ylabel("Margin")
@@ -107,16 +156,15 @@ def plot_top_zipcode_frequency(df: pd.DataFrame, top_n: int = 20):
         return
 
     freq = (
-        df.groupby("PostalCode")["ClaimFrequency"]
-        .mean()
-        .sort_values(ascending=False)
-        .head(top_n)
+        _group_mean(df["PostalCode"], df["ClaimFrequency"])
+        .nlargest(top_n)
         .reset_index()
     )
 
     plt.figure(figsize=(10, 6))
-    sns.barplot(data=freq, x="PostalCode", y="ClaimFrequency")
-    plt.xticks(rotation=45, ha="right")
+    plt.bar(np.arange(len(freq)), freq["ClaimFrequency"].to_numpy())
+    plt.xticks(np.arange(len(freq)), freq["PostalCode"].astype(str), rotation=45, ha="right")
+    plt.xlabel("PostalCode")
     plt.title(f"Top {top_n} Zip Codes by Claim Frequency")
     plt.ylabel("Claim Frequency")
     plt.tight_layout()
@@ -1,18 +1,54 @@
 # src/insurance_analytics/viz/plots.py
 
+import os
+
+import matplotlib
+
+# Headless jobs render straight to files; no GUI backend is imported
+if os.environ.get("INSURANCE_HEADLESS"):
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
+from insurance_analytics.viz._dtypes import _to_f32
+
 sns.set_theme(style="whitegrid")
 
 
+def _get_axes(ax, figsize):
+    """Return (fig, ax): a new figure, or the given axes cleared for reuse."""
+    if ax is None:
+        return plt.subplots(figsize=figsize)
+    ax.clear()
+    return ax.figure, ax
+
+
+def _finish(save_path, fig=None, close=True):
+    """
+    Save and close the figure when `save_path` is given, otherwise show it.
+
+    Closing releases the figure's buffers instead of keeping them alive in
+    pyplot until the session ends; pass ``close=False`` for figures the
+    caller reuses through ``ax``.
+    """
+    fig = fig if fig is not None else plt.gcf()
+    if save_path:
+        fig.savefig(save_path, dpi=300)
+        if close:
+            plt.close(fig)
+    else:
+        plt.show()
+
 
 # -------------------------------------------------------------
 # 2) UNIVARIATE ANALYSIS
 # -------------------------------------------------------------
-def plot_histogram(df: pd.DataFrame, column: str, bins: int = 30, save_path: Path = None):
+def plot_histogram(df: pd.DataFrame, column: str, bins: int = 30, save_path: Path = None,
+                   ax=None):
     """
     Plot a histogram for a numeric column.
 
@@ -26,21 +62,41 @@ def plot_histogram(df: pd.DataFrame, column: str, bins: int = 30, save_path: Pat
         Number of bins in histogram.
     save_path : Path, optional
         Path to save the plot image.
+    ax : matplotlib.axes.Axes, optional
+        Axes to clear and draw into, so loops can reuse one figure.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The plotted figure.
     """
-    plt.figure(figsize=(10, 5))
-    ax = sns.histplot(df[column].dropna(), bins=bins,
-                      kde=True, color="skyblue")
+    reuse_ax = ax is not None
+    fig, ax = _get_axes(ax, figsize=(10, 5))
+    sns.histplot(df[column].dropna(), bins=bins,
+                 kde=True, color="skyblue", ax=ax)
     ax.set_title(f"Distribution of {column}")
     ax.set_xlabel(column)
     ax.set_ylabel("Frequency")
-    plt.tight_layout()
+    fig.tight_layout()
+
+    _finish(save_path, fig, close=not reuse_ax)
+    return fig
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+
+def _top_value_counts(values: pd.Series, top_n: int) -> pd.Series:
+    """
+    value_counts().nlargest(top_n) without hashing objects per row: counts
+    come from bincount over factor codes. Codes follow first appearance, so a
+    stable sort over the categories breaks ties the same way value_counts does.
+    """
+    codes, uniques = pd.factorize(values)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    top = np.argsort(-counts, kind="stable")[:top_n]
+    return pd.Series(counts[top], index=pd.Index(uniques[top], name=values.name), name="count")
 
 
-def plot_bar(df: pd.DataFrame, column: str, top_n: int = 20, save_path: Path = None):
+def plot_bar(df: pd.DataFrame, column: str, top_n: int = 20, save_path: Path = None,
+             ax=None):
     """
     Plot a bar chart for categorical columns showing top N categories.
 
@@ -54,19 +110,26 @@ def plot_bar(df: pd.DataFrame, column: str, top_n: int = 20, save_path: Path = N
         Show top N categories only.
     save_path : Path, optional
         Path to save the plot image.
+    ax : matplotlib.axes.Axes, optional
+        Axes to clear and draw into, so loops can reuse one figure.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The plotted figure.
     """
-    counts = df[column].value_counts().nlargest(top_n)
-    plt.figure(figsize=(12, 6))
-    ax = sns.barplot(x=counts.index, y=counts.values, palette="pastel")
+    counts = _top_value_counts(df[column], top_n)
+    reuse_ax = ax is not None
+    fig, ax = _get_axes(ax, figsize=(12, 6))
+    sns.barplot(x=counts.index, y=counts.values, palette="pastel", ax=ax)
     ax.set_title(f"Top {top_n} {column} Categories")
     ax.set_xlabel(column)
     ax.set_ylabel("Count")
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+    ax.tick_params(axis="x", labelrotation=45)
+    fig.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+    _finish(save_path, fig, close=not reuse_ax)
+    return fig
 
 
 def missing_data_summary(df: pd.DataFrame, top_n: int = 20):
@@ -101,15 +164,19 @@ def boxplot_numeric(df: pd.DataFrame, column: str, save_path: Path = None):
         Column to visualize.
     save_path : Path, optional
         Path to save the plot image.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The plotted figure.
     """
-    plt.figure(figsize=(10, 5))
+    fig = plt.figure(figsize=(10, 5))
     ax = sns.boxplot(x=df[column], color="lightcoral")
     ax.set_title(f"Boxplot of {column}")
     plt.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+    _finish(save_path, fig)
+    return fig
 
 
 
@@ -134,16 +201,22 @@ def correlation_matrix(df: pd.DataFrame, numeric_cols=None, save_path: Path = No
     if numeric_cols is None:
         numeric_cols = df.select_dtypes(include="number").columns.tolist()
 
-    corr = df[numeric_cols].corr()
+    data = df[numeric_cols]
+    if data.isna().to_numpy().any():
+        # pairwise NaN handling needs pandas' per-pair implementation
+        corr = data.corr()
+    else:
+        # clean data: one contiguous float32 matrix through np.corrcoef
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mat = np.corrcoef(data.to_numpy(dtype=np.float32), rowvar=False)
+        corr = pd.DataFrame(np.atleast_2d(mat), index=numeric_cols, columns=numeric_cols)
 
     plt.figure(figsize=(12, 10))
     ax = sns.heatmap(corr, annot=True, fmt=".2f", cmap="coolwarm", cbar=True)
     ax.set_title("Correlation Matrix")
     plt.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+    _finish(save_path)
     return corr
 
 
@@ -165,16 +238,20 @@ def scatter_by_group(
         Column for color grouping.
     save_path : Path, optional
         Path to save the plot image.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The plotted figure.
     """
-    plt.figure(figsize=(12, 6))
+    fig = plt.figure(figsize=(12, 6))
     ax = sns.scatterplot(x=x_col, y=y_col, hue=hue_col,
                          data=df, alpha=0.6, palette="tab10")
     ax.set_title(f"{y_col} vs {x_col} by {hue_col}")
     plt.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+    _finish(save_path, fig)
+    return fig
 
 
 def boxplot_by_category(df: pd.DataFrame, numeric_col: str, category_col: str, save_path: Path = None):
@@ -191,16 +268,20 @@ def boxplot_by_category(df: pd.DataFrame, numeric_col: str, category_col: str, s
         Column with categorical grouping.
     save_path : Path, optional
         Path to save the plot image.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The plotted figure.
     """
-    plt.figure(figsize=(12, 6))
+    fig = plt.figure(figsize=(12, 6))
     ax = sns.boxplot(x=category_col, y=numeric_col, data=df, palette="pastel")
     ax.set_title(f"{numeric_col} by {category_col}")
     plt.xticks(rotation=45)
     plt.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+    _finish(save_path, fig)
+    return fig
 
 
 def pairplot_numeric(df: pd.DataFrame, numeric_cols=None, hue_col=None, save_path: Path = None):
@@ -225,9 +306,7 @@ def pairplot_numeric(df: pd.DataFrame, numeric_cols=None, hue_col=None, save_pat
         df[numeric_cols + ([hue_col] if hue_col else [])], hue=hue_col)
     plt.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+    _finish(save_path, pairplot.figure)
 
 def plot_loss_ratio_by_province(df: pd.DataFrame, save_path: Path = None):
     """
@@ -239,13 +318,23 @@ def plot_loss_ratio_by_province(df: pd.DataFrame, save_path: Path = None):
         Cleaned insurance dataset with 'Province' and 'LossRatio' columns.
     save_path : Path, optional
         Path to save the plot image.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The plotted figure.
     """
-    plt.figure(figsize=(12, 6))
+    # Aggregate once and hand seaborn plain arrays (one bar per province)
+    agg = _to_f32(df[["Province", "LossRatio"]]).groupby(
+        "Province", observed=True, sort=False)["LossRatio"].mean()
+
+    fig = plt.figure(figsize=(12, 6))
     ax = sns.barplot(
-        x="Province",
-        y="LossRatio",
-        data=df.groupby("Province")["LossRatio"].mean().reset_index(),
-        palette="Blues_r"
+        x=agg.index.to_numpy(),
+        y=agg.to_numpy(),
+        hue=agg.index.to_numpy(),
+        palette="Blues_r",
+        legend=False
     )
     ax.set_title("Average Loss Ratio by Province")
     ax.set_ylabel("Loss Ratio")
@@ -253,9 +342,8 @@ def plot_loss_ratio_by_province(df: pd.DataFrame, save_path: Path = None):
     plt.xticks(rotation=45, ha="right")
     plt.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+    _finish(save_path, fig)
+    return fig
 
 
 def plot_loss_ratio_distribution(df: pd.DataFrame, save_path: Path = None):
@@ -268,17 +356,21 @@ def plot_loss_ratio_distribution(df: pd.DataFrame, save_path: Path = None):
         Cleaned insurance dataset with 'LossRatio'.
     save_path : Path, optional
         Path to save the plot image.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The plotted figure.
     """
-    plt.figure(figsize=(10, 5))
-    sns.histplot(df["LossRatio"].dropna(), bins=50, kde=True, color="orange")
+    fig = plt.figure(figsize=(10, 5))
+    sns.histplot(_to_f32(df["LossRatio"]).dropna(), bins=50, kde=True, color="orange")
     plt.title("Distribution of Loss Ratio")
     plt.xlabel("Loss Ratio")
     plt.ylabel("Frequency")
     plt.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+    _finish(save_path, fig)
+    return fig
 
 
 def plot_claims_vs_premium_by_vehicle(df: pd.DataFrame, save_path: Path = None):
@@ -291,13 +383,18 @@ def plot_claims_vs_premium_by_vehicle(df: pd.DataFrame, save_path: Path = None):
         Cleaned insurance dataset with 'TotalClaims', 'TotalPremium', 'VehicleType'.
     save_path : Path, optional
         Path to save the plot image.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The plotted figure.
     """
-    plt.figure(figsize=(12, 6))
+    fig = plt.figure(figsize=(12, 6))
     sns.scatterplot(
         x="TotalPremium",
         y="TotalClaims",
         hue="VehicleType",
-        data=df,
+        data=_to_f32(df[["TotalPremium", "TotalClaims", "VehicleType"]]),
         alpha=0.6,
         palette="tab10"
     )
@@ -308,9 +405,8 @@ def plot_claims_vs_premium_by_vehicle(df: pd.DataFrame, save_path: Path = None):
         1.05, 1), loc="upper left")
     plt.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+    _finish(save_path, fig)
+    return fig
 
 # src/insurance_analytics/viz/outliers.py
 
@@ -322,7 +418,7 @@ sns.set_theme(style="whitegrid")
 # -------------------------------------------------------------
 
 
-def boxplot_outliers(df: pd.DataFrame, column: str, save_path: Path = None):
+def boxplot_outliers(df: pd.DataFrame, column: str, save_path: Path = None, ax=None):
     """
     Visualize outliers in a numeric column using a boxplot.
 
@@ -334,16 +430,23 @@ def boxplot_outliers(df: pd.DataFrame, column: str, save_path: Path = None):
         Column name to visualize
     save_path : Path, optional
         Path to save the plot image
+    ax : matplotlib.axes.Axes, optional
+        Axes to clear and draw into, so loops can reuse one figure.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The plotted figure.
     """
-    plt.figure(figsize=(10, 6))
-    ax = sns.boxplot(x=df[column], color="lightcoral")
+    reuse_ax = ax is not None
+    fig, ax = _get_axes(ax, figsize=(10, 6))
+    sns.boxplot(x=df[column], color="lightcoral", ax=ax)
     ax.set_title(f"Boxplot of {column} (Outlier Detection)")
     ax.set_xlabel(column)
-    plt.tight_layout()
+    fig.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+    _finish(save_path, fig, close=not reuse_ax)
+    return fig
 
 
 # -------------------------------------------------------------
@@ -365,16 +468,20 @@ def scatter_outliers(df: pd.DataFrame, x_col: str, y_col: str, hue_col: str = No
         Column to color points by category
     save_path : Path, optional
         Path to save the plot image
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The plotted figure.
     """
-    plt.figure(figsize=(12, 6))
+    fig = plt.figure(figsize=(12, 6))
     ax = sns.scatterplot(x=x_col, y=y_col, hue=hue_col,
                          data=df, palette="tab10", alpha=0.6)
     ax.set_title(f"{y_col} vs {x_col} (Outlier Inspection)")
     plt.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+    _finish(save_path, fig)
+    return fig
 
 
 # -------------------------------------------------------------
@@ -392,26 +499,28 @@ def highlight_outliers_iqr(df: pd.DataFrame, column: str, save_path: Path = None
         Column name for outlier detection
     save_path : Path, optional
         Path to save the plot
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The plotted figure.
     """
-    q1 = df[column].quantile(0.25)
-    q3 = df[column].quantile(0.75)
+    # Local arrays only: the caller's frame is never mutated
+    values = df[column].to_numpy(dtype=float)
+    q1, q3 = np.nanquantile(values, [0.25, 0.75])
     iqr = q3 - q1
     lower = q1 - 1.5 * iqr
     upper = q3 + 1.5 * iqr
 
-    df['is_outlier'] = (df[column] < lower) | (df[column] > upper)
+    is_outlier = (values < lower) | (values > upper)
 
-    plt.figure(figsize=(12, 6))
-    ax = sns.scatterplot(x=df.index, y=df[column], hue=df['is_outlier'], palette={
+    fig = plt.figure(figsize=(12, 6))
+    ax = sns.scatterplot(x=df.index, y=values, hue=is_outlier, palette={
                          True: 'red', False: 'blue'})
     ax.set_title(f"Outlier Highlighting for {column}")
     ax.set_xlabel("Index")
     ax.set_ylabel(column)
     plt.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
-
-    # Remove temporary column
-    df.drop(columns=['is_outlier'], inplace=True)
+    _finish(save_path, fig)
+    return fig
@@ -0,0 +1,210 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from insurance_analytics.eda import exploration
+from insurance_analytics.eda.stat import descriptive_statistics
+from insurance_analytics.preprocessing.cleaner import (
+    clean_strings, fix_numeric, optimize_dtypes
+)
+
+
+class TestCleanStrings(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            "text": pd.Series([" a ", "", None, ".000000000000"], dtype=object),
+            "number": pd.Series([" 5 ", "6", "7", None], dtype=object),
+            "count": [1, 2, 3, 4],
+        })
+
+    def test_strips_and_normalizes_values(self):
+        out = clean_strings(self.df.copy())
+        self.assertEqual(out["text"].iloc[0], "a")
+        self.assertTrue(pd.isna(out["text"].iloc[1]))
+        self.assertTrue(pd.isna(out["text"].iloc[2]))
+        self.assertEqual(out["text"].iloc[3], "0")
+
+    def test_keeps_original_dtypes(self):
+        out = clean_strings(self.df.copy())
+        self.assertEqual(out.dtypes.to_dict(), self.df.dtypes.to_dict())
+        # missing values stay NaN in object columns, not pd.NA
+        self.assertIs(out["text"].iloc[1], np.nan)
+
+    def test_fix_numeric_after_clean_gives_numpy_dtype(self):
+        out = fix_numeric(clean_strings(self.df.copy()))
+        self.assertEqual(out["number"].dtype, np.float64)
+        np.testing.assert_array_equal(out["number"].to_numpy(), [5.0, 6.0, 7.0, np.nan])
+
+    def test_no_string_columns_is_a_no_op(self):
+        df = pd.DataFrame({"count": [1, 2]})
+        self.assertIs(clean_strings(df), df)
+
+
+class TestFixNumericAndDtypes(unittest.TestCase):
+    def test_converts_mostly_numeric_columns_only(self):
+        df = pd.DataFrame({
+            "amount": pd.Series(["1.5", "2", None, "x"] + ["3"] * 96, dtype=object),
+            "label": pd.Series(["a", "b", "1", None] + ["c"] * 96, dtype=object),
+        })
+        out = fix_numeric(df.copy(), min_numeric_frac=0.95)
+        expected = pd.to_numeric(df["amount"], errors="coerce")
+        np.testing.assert_array_equal(out["amount"].to_numpy(), expected.to_numpy())
+        self.assertEqual(out["label"].dtype, object)
+
+    def test_optimize_dtypes_downcasts_without_changing_values(self):
+        df = pd.DataFrame({
+            "count": np.array([1, 2, 300], dtype=np.int64),
+            "premium": [1.5, np.nan, 2.25],
+            "province": pd.Series(["Gauteng", "Gauteng", "Limpopo"] * 1, dtype=object),
+        })
+        out = optimize_dtypes(df.copy(), max_unique_ratio=0.9)
+        self.assertEqual(out["count"].dtype, np.int16)
+        self.assertEqual(out["premium"].dtype, np.float32)
+        self.assertIsInstance(out["province"].dtype, pd.CategoricalDtype)
+        np.testing.assert_array_equal(out["count"].to_numpy(), df["count"].to_numpy())
+        np.testing.assert_array_equal(out["premium"].to_numpy(), df["premium"].to_numpy())
+
+    def test_optimize_dtypes_on_empty_frame(self):
+        out = optimize_dtypes(pd.DataFrame({"a": pd.Series([], dtype=object)}))
+        self.assertEqual(len(out), 0)
+
+
+def _reference_outliers(df, col):
+    # the filtered-frame count detect_outliers_iqr used to return
+    q1, q3 = df[col].quantile(0.25), df[col].quantile(0.75)
+    iqr = q3 - q1
+    return len(df[(df[col] < q1 - 1.5 * iqr) | (df[col] > q3 + 1.5 * iqr)])
+
+
+class TestOutlierCounts(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({
+            "normal": np.append(rng.normal(size=40), [15.0, -12.0]),
+            "with_nan": np.append(rng.standard_cauchy(40), [np.nan, np.nan]),
+            "all_nan": np.full(42, np.nan),
+            "constant": np.full(42, 3.0),
+            "integers": rng.integers(0, 5, size=42),
+            "text": ["a"] * 42,
+        })
+        self.cols = ["normal", "with_nan", "all_nan", "constant", "integers"]
+
+    def _expected(self, df, cols):
+        return {c: _reference_outliers(df, c) for c in cols}
+
+    def test_count_outliers_matches_reference(self):
+        for col in self.cols:
+            self.assertEqual(exploration.count_outliers_iqr(self.df, col),
+                             _reference_outliers(self.df, col), col)
+
+    def test_batch_matches_reference(self):
+        self.assertEqual(exploration.detect_outliers_iqr_batch(self.df, self.cols),
+                         self._expected(self.df, self.cols))
+        self.assertEqual(exploration.detect_outliers_iqr_batch(self.df, []), {})
+        with self.assertRaises(ValueError):
+            exploration.detect_outliers_iqr_batch(self.df, ["missing"])
+
+    def test_wide_batch_matches_reference_with_and_without_numba(self):
+        rng = np.random.default_rng(1)
+        wide = pd.DataFrame(rng.standard_cauchy((50, exploration.NUMBA_MIN_COLS + 4)))
+        wide.columns = [f"c{i}" for i in wide.columns]
+        wide.iloc[::7, 0] = np.nan
+        cols = list(wide.columns)
+        expected = self._expected(wide, cols)
+        self.assertEqual(exploration.detect_outliers_iqr_batch(wide, cols), expected)
+        with mock.patch.object(exploration, "njit", None):
+            self.assertEqual(exploration.detect_outliers_iqr_batch(wide, cols), expected)
+
+    @unittest.skipIf(exploration.njit is None, "numba not installed")
+    def test_numba_kernel_matches_reference(self):
+        cols = ["normal", "with_nan", "integers"]
+        counts = exploration.numba_iqr_counts(self.df[cols].to_numpy(dtype=float))
+        self.assertEqual(dict(zip(cols, counts.tolist())), self._expected(self.df, cols))
+
+    def test_missing_and_outlier_counts_match_pandas(self):
+        expected_missing = self.df[self.cols].isna().sum().to_dict()
+        expected_outliers = self._expected(self.df, self.cols)
+        for njit in (exploration.njit, None):
+            with mock.patch.object(exploration, "njit", njit):
+                missing, outliers = exploration.missing_and_outlier_counts(self.df, self.cols)
+            self.assertEqual(missing, expected_missing)
+            self.assertEqual(outliers, expected_outliers)
+        self.assertEqual(exploration.missing_and_outlier_counts(self.df, []), ({}, {}))
+
+    def test_single_row_and_degenerate_only(self):
+        one = self.df.iloc[:1]
+        self.assertEqual(exploration.detect_outliers_iqr_batch(one, self.cols),
+                         dict.fromkeys(self.cols, 0))
+        missing, outliers = exploration.missing_and_outlier_counts(self.df, ["all_nan", "constant"])
+        self.assertEqual(missing, {"all_nan": 42, "constant": 0})
+        self.assertEqual(outliers, {"all_nan": 0, "constant": 0})
+
+
+class TestColumnInspection(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            "i": [1, 2, 2], "f": [1.0, np.nan, np.nan], "u": np.array([1, 2, 2], dtype=np.uint8),
+            "o": pd.Series(["a", None, None], dtype=object), "b": [True, False, False],
+            "d": pd.to_datetime(["2020-01-01"] * 3),
+        })
+
+    def test_numeric_columns_match_select_dtypes(self):
+        expected = self.df.select_dtypes(include="number").columns.tolist()
+        self.assertEqual(exploration.numeric_columns(self.df), expected)
+        numeric, categorical = exploration.partition_columns(self.df)
+        self.assertEqual(numeric, expected)
+        self.assertEqual(categorical, ["o"])
+
+    def test_summarize_missing_matches_isna_mean(self):
+        expected = self.df.isna().mean().sort_values(ascending=False)
+        pd.testing.assert_series_equal(exploration.summarize_missing(self.df, top_n=None), expected,
+                                       check_index=False)
+        self.assertEqual(exploration.summarize_missing(self.df, top_n=2).max(), 2 / 3)
+
+    def test_duplicated_rows_cache_follows_shape(self):
+        df = self.df.copy()
+        self.assertEqual(exploration.duplicated_rows(df), 1)
+        df = pd.concat([df, df.iloc[:1]], ignore_index=True)
+        self.assertEqual(exploration.duplicated_rows(df), 2)
+
+    def test_duplicated_rows_cache_is_not_shared_with_derived_frames(self):
+        df = pd.DataFrame({"a": [1, 1, np.nan], "b": [2, 2, 3]})
+        self.assertEqual(exploration.duplicated_rows(df), 1)
+        # fillna copies attrs; the derived frame has the same shape
+        derived = df.fillna(5)
+        derived.iloc[1] = [9, 9]
+        self.assertEqual(exploration.duplicated_rows(derived), int(derived.duplicated().sum()))
+        self.assertEqual(exploration.duplicated_rows(df), 1)
+
+
+class TestDescriptiveStatistics(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            "Premium": [10.25, np.nan, 3.5, 7.75],
+            "Count": np.array([1, 2, 3, 400], dtype=np.int64),
+            "Province": ["Gauteng", "Limpopo", None, "Gauteng"],
+        })
+
+    def _reference(self, df, cols, round_digits=2):
+        stats = df[cols].agg(["count", "mean", "median", "std", "min", "max"])
+        stats = stats.round(round_digits).T
+        stats.index.name = "Column"
+        return stats
+
+    def test_downcast_matches_float64_aggregates(self):
+        expected = self._reference(self.df, ["Premium", "Count"])
+        for downcast in (True, False):
+            out = descriptive_statistics(self.df, downcast=downcast)
+            pd.testing.assert_frame_equal(out, expected, check_dtype=False, atol=0.011)
+
+    def test_single_row_and_all_nan(self):
+        df = pd.DataFrame({"Premium": [5.0], "Empty": [np.nan]})
+        pd.testing.assert_frame_equal(descriptive_statistics(df),
+                                      self._reference(df, ["Premium", "Empty"]),
+                                      check_dtype=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from insurance_analytics.preprocessing import feature_engineering as fe
+from insurance_analytics.preprocessing.eda_prep import DataPreprocessor
+
+
+class TestBinNumeric(unittest.TestCase):
+    def _reference(self, values, bins):
+        codes = pd.qcut(values, q=bins, labels=False, duplicates="drop")
+        return codes.fillna(-1).astype(int).to_numpy()
+
+    def test_matches_qcut_codes(self):
+        rng = np.random.default_rng(0)
+        values = pd.Series(np.append(rng.normal(size=50), [np.nan, np.nan]))
+        for bins in (2, 4, 5):
+            out = fe.bin_numeric(pd.DataFrame({"Age": values}), "Age", bins=bins)
+            np.testing.assert_array_equal(out["Age_bin"].to_numpy(), self._reference(values, bins))
+
+    def test_duplicate_edges_and_values_on_edges(self):
+        values = pd.Series([0.0, 0.0, 0.0, 0.0, 1.0, 2.0, 2.0, 3.0, 10.0, np.nan])
+        out = fe.bin_numeric(pd.DataFrame({"Claims": values}), "Claims", bins=4)
+        np.testing.assert_array_equal(out["Claims_bin"].to_numpy(), self._reference(values, 4))
+
+    def test_all_nan_and_non_numeric_columns(self):
+        out = fe.bin_numeric(pd.DataFrame({"x": [np.nan, np.nan]}), "x")
+        np.testing.assert_array_equal(out["x_bin"].to_numpy(), [-1, -1])
+        text = pd.DataFrame({"x": pd.Series(["a", "b"], dtype=object)})
+        self.assertNotIn("x_bin", fe.bin_numeric(text, "x").columns)
+
+
+class TestEncodingsAndInteractions(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            "Bank": pd.Series(["A", "B", "A", None, "C", "B"], dtype=object),
+            "Premium": [10.0, 20.0, np.nan, 5.0, 7.0, 40.0],
+            "Age": [1, 2, 3, 4, 5, 6],
+            "Constant": [1, 1, 1, 1, 1, 1],
+        })
+
+    def test_target_encode_matches_groupby_map(self):
+        out = fe.target_encode(self.df.copy(), "Bank", "Premium")
+        expected = self.df["Bank"].map(self.df.groupby("Bank")["Premium"].mean())
+        np.testing.assert_array_equal(out["Bank_te"].to_numpy(), expected.to_numpy())
+
+    def test_interactions_match_column_products(self):
+        pairs = [("Premium", "Age"), ("Age", "Age"), ("Age", "Missing")]
+        out = fe.add_interactions(self.df.copy(), pairs)
+        np.testing.assert_array_equal(out["Premium_x_Age"].to_numpy(),
+                                      (self.df["Premium"] * self.df["Age"]).to_numpy())
+        np.testing.assert_array_equal(out["Age_x_Age"].to_numpy(),
+                                      (self.df["Age"] * self.df["Age"]).to_numpy())
+        self.assertNotIn("Age_x_Missing", out.columns)
+        out32 = fe.add_interactions(self.df.copy(), pairs[:1], dtype=np.float32)
+        self.assertEqual(out32["Premium_x_Age"].dtype, np.float32)
+
+    def test_remove_low_variance_matches_full_nunique(self):
+        # the constant candidate changes after the sampled head
+        df = pd.DataFrame({"late": [0] * 300 + [1], "flat": [2] * 301, "nan": [np.nan] * 301})
+        expected = [c for c in df.columns if df[c].nunique() > 1]
+        self.assertEqual(fe.remove_low_variance(df).columns.tolist(), expected)
+        self.assertEqual(fe.remove_low_variance(self.df).columns.tolist(),
+                         [c for c in self.df.columns if self.df[c].nunique() > 1])
+
+    def test_loss_ratio_leaves_input_untouched(self):
+        df = pd.DataFrame({"TotalClaims": [5.0, 1.0], "TotalPremium": [10.0, 0.0]})
+        out = fe.add_loss_ratio(df)
+        np.testing.assert_array_equal(out["LossRatio"].to_numpy(), [0.5, np.nan])
+        self.assertNotIn("LossRatio", df.columns)
+
+
+def _raw_policies():
+    return pd.DataFrame({
+        "TotalPremium": pd.Series(["100", "R50", None, "25.5", "0", "12"], dtype=object),
+        "TotalClaims": pd.Series(["0", "30", "5", None, "x", "1"], dtype=object),
+        "CustomValueEstimate": [np.nan, 1000.0, np.nan, 3000.0, 2000.0, np.nan],
+        "TransactionMonth": ["2015-03-01", "2015-04-01", None, "2015-06-01", "2015-07-01", "2015-08-01"],
+        "VehicleIntroDate": ["2010-01-01", None, "2012-05-01", "2014-06-01", "2015-07-01", "2001-02-28"],
+        "Cylinders": [4.0, np.nan, 6.0, 4.0, 8.0, np.nan],
+        "Province": pd.Series(["Gauteng", None, "Limpopo", "Gauteng", None, "Limpopo"], dtype=object),
+        "Gender": pd.Series(["Male", "Female", None, "Male", "Female", "Male"], dtype=object),
+        "PostalCode": [2000, 2001, np.nan, 2000, 2002, 2001],
+        "WrittenOff": pd.Series(["Yes", "No", None, "Yes", "Maybe", "No"], dtype=object),
+        "NumberOfVehiclesInFleet": [np.nan] * 6,
+        "Make": pd.Series(["Toyota", "Toyota", "BMW", "Audi", None, "Toyota"], dtype=object),
+    })
+
+
+def _reference_coerce(df):
+    # the step-by-step cleaning _coerce_all replaced
+    df = df.copy()
+    for col in ["TotalPremium", "TotalClaims", "CustomValueEstimate"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    for col in ["TransactionMonth", "VehicleIntroDate"]:
+        df[col] = pd.to_datetime(df[col], errors="coerce")
+    df["Cylinders"] = df["Cylinders"].fillna(-1).astype(int).astype("category")
+    for col in ["Province", "Gender"]:
+        df[col] = df[col].astype("category")
+    df[["TotalClaims", "TotalPremium"]] = df[["TotalClaims", "TotalPremium"]].fillna(0)
+    df["WrittenOff"] = df["WrittenOff"].fillna("No").map({"Yes": True, "No": False}).fillna(True).astype(bool)
+    for col in ["Province", "Gender", "PostalCode"]:
+        df[col] = df[col].astype("category").cat.add_categories("MISSING").fillna("MISSING")
+    df["ValueEstimate_MISSING"] = df["CustomValueEstimate"].isnull()
+    df["CustomValueEstimate"] = df["CustomValueEstimate"].fillna(df["CustomValueEstimate"].median())
+    df["IsFleetPolicy"] = df["NumberOfVehiclesInFleet"].notna()
+    df["NumberOfVehiclesInFleet"] = df["NumberOfVehiclesInFleet"].fillna(1).astype(int)
+    return df
+
+
+class TestDataPreprocessor(unittest.TestCase):
+    def test_coerce_all_matches_step_by_step_cleaning(self):
+        raw = _raw_policies()
+        out = DataPreprocessor(raw)._coerce_all()
+        expected = _reference_coerce(raw)
+        self.assertEqual(list(out.columns), list(expected.columns))
+        for col in expected.columns:
+            pd.testing.assert_series_equal(out[col], expected[col], check_dtype=False,
+                                           check_categorical=False)
+
+    def test_high_cardinality_matches_value_count_grouping(self):
+        prep = DataPreprocessor(_raw_policies())
+        make = prep.df["Make"]
+        counts = make.value_counts()
+        expected = np.where(make.isin(counts[counts >= 2].index), make, "Other_Category")
+        out = prep._handle_high_cardinality(threshold=2)
+        np.testing.assert_array_equal(out["Make"].astype(object).to_numpy(), expected)
+
+    def test_high_cardinality_below_threshold_is_unchanged(self):
+        prep = DataPreprocessor(_raw_policies())
+        before = prep.df["Make"].copy()
+        out = prep._handle_high_cardinality(threshold=100)
+        pd.testing.assert_series_equal(out["Make"], before)
+
+    def test_eda_features_match_pandas(self):
+        prep = DataPreprocessor(_raw_policies())
+        df = prep._coerce_all().copy()
+        out = prep._create_eda_features()
+        np.testing.assert_array_equal(out["HasClaim"].to_numpy(),
+                                      np.where(df["TotalClaims"] > 0, 1, 0))
+        expected_age = (df["TransactionMonth"] - df["VehicleIntroDate"]).dt.days / 365.25
+        np.testing.assert_allclose(out["VehicleAge_Years"].to_numpy(), expected_age.to_numpy(),
+                                   rtol=1e-6)
+        self.assertTrue(np.isnan(out["VehicleAge_Years"].iloc[1]))
+
+    def test_empty_frame(self):
+        out = DataPreprocessor(_raw_policies().iloc[0:0]).run_pipeline()
+        self.assertEqual(len(out), 0)
+        self.assertIn("HasClaim", out.columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
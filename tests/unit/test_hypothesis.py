@@ -0,0 +1,346 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from insurance_analytics.hypothesis import balance_checks, metrics, segmentation
+from insurance_analytics.hypothesis import statistical_tests as st
+from insurance_analytics.utils.metrics import safe_mean, safe_std
+from insurance_analytics.viz import ab_plots, plots
+from insurance_analytics.viz._dtypes import _to_f32
+
+
+def _policies():
+    """Small frame with missing values in the feature and the KPIs."""
+    return pd.DataFrame({
+        "Province": ["Gauteng", "Limpopo", None, "Gauteng", "Limpopo",
+                     "Gauteng", "Limpopo", "Gauteng", "Limpopo", "Gauteng"],
+        "Gender": ["Male", "Female", "Male", "Female", None,
+                   "Male", "Female", "Male", "Female", "Male"],
+        "ClaimFrequency": [1, 0, 0, 1, 1, 0, 0, 1, 0, 0],
+        "ClaimSeverity": [120.0, np.nan, 3.5, 80.0, 40.0, np.nan, 7.0, 60.0, 2.0, 15.0],
+        "Margin": [-20.0, 5.0, 1.5, np.nan, -3.0, 8.0, 4.0, -1.0, 6.0, 2.5],
+    })
+
+
+class TestContingencyTable(unittest.TestCase):
+    def _crosstab(self, a, b, n_a, n_b):
+        table = pd.crosstab(a[(a >= 0) & (b >= 0)], b[(a >= 0) & (b >= 0)])
+        return table.reindex(index=range(n_a), columns=range(n_b), fill_value=0).to_numpy()
+
+    def test_matches_crosstab_and_skips_missing_codes(self):
+        a = np.array([0, 1, 2, -1, 1, 0, 2, 2])
+        b = np.array([1, 0, 1, 1, -1, 1, 0, 0])
+        np.testing.assert_array_equal(
+            st.contingency_table(a, b, 3, 2), self._crosstab(a, b, 3, 2))
+
+    def test_empty_input_gives_zero_table(self):
+        empty = np.array([], dtype=np.intp)
+        np.testing.assert_array_equal(
+            st.contingency_table(empty, empty, 2, 3), np.zeros((2, 3), dtype=np.int64))
+
+    @unittest.skipIf(st.njit is None, "numba not installed")
+    def test_numba_kernel_matches_bincount(self):
+        rng = np.random.default_rng(0)
+        a = rng.integers(-1, 4, size=1000)
+        b = rng.integers(-1, 3, size=1000)
+        for n_chunks in (1, 3, 8):
+            np.testing.assert_array_equal(
+                st._contingency_kernel(a, b, 4, 3, n_chunks), self._crosstab(a, b, 4, 3))
+
+
+class TestChi2Categorical(unittest.TestCase):
+    def test_matches_crosstab_chi2(self):
+        df = _policies()
+        expected = stats.chi2_contingency(pd.crosstab(df["Province"], df["ClaimFrequency"]))
+        chi2, p = st.chi2_test_categorical(df, "Province")
+        self.assertAlmostEqual(chi2, expected[0])
+        self.assertAlmostEqual(p, expected[1])
+
+
+class TestTTests(unittest.TestCase):
+    def _reference(self, df, feature, kpi):
+        levels = df[feature].dropna().unique()
+        g1 = df[df[feature] == levels[0]][kpi].dropna()
+        g2 = df[df[feature] == levels[1]][kpi].dropna()
+        return stats.ttest_ind(g1, g2, equal_var=False)
+
+    def test_t_test_matches_scipy_on_filtered_groups(self):
+        df = _policies()
+        for kpi in ("ClaimSeverity", "Margin"):
+            expected = self._reference(df, "Gender", kpi)
+            t_stat, p_value = st.t_test_numeric(df, "Gender", kpi)
+            self.assertAlmostEqual(t_stat, expected.statistic)
+            self.assertAlmostEqual(p_value, expected.pvalue)
+
+    def test_t_test_requires_two_levels(self):
+        df = _policies()
+        single = df.assign(Gender="Male")
+        with self.assertRaises(ValueError):
+            st.t_test_numeric(single, "Gender", "Margin")
+        three = df.assign(Gender=["A", "B", "C"] * 3 + ["A"])
+        with self.assertRaises(ValueError):
+            st.t_test_numeric(three, "Gender", "Margin")
+
+    def test_batch_matches_single_tests(self):
+        df = _policies()
+        kpis = ["ClaimSeverity", "Margin"]
+        t_stats, p_values = st.t_test_numeric_batch(df, "Gender", kpis)
+        for kpi, t_stat, p_value in zip(kpis, t_stats, p_values):
+            expected = st.t_test_numeric(df, "Gender", kpi)
+            self.assertAlmostEqual(t_stat, expected[0])
+            self.assertAlmostEqual(p_value, expected[1])
+
+    def test_run_hypothesis_tests_batches_t_tests(self):
+        df = _policies()
+        hypotheses = [
+            {"feature": "Gender", "kpi": "ClaimSeverity", "test_type": "t"},
+            {"feature": "Gender", "kpi": "Margin", "test_type": "t"},
+            {"feature": "Province", "kpi": "ClaimFrequency", "test_type": "chi2"},
+        ]
+        results = st.run_hypothesis_tests(df, hypotheses)
+        for row, kpi in zip(results.itertuples(), ["ClaimSeverity", "Margin"]):
+            expected = self._reference(df, "Gender", kpi)
+            self.assertAlmostEqual(row.statistic, expected.statistic)
+            self.assertAlmostEqual(row.p_value, expected.pvalue)
+        self.assertEqual(results["test_type"].tolist(), ["t", "t", "chi2"])
+
+
+class TestBalanceChecks(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.control = pd.DataFrame({
+            "Age": rng.normal(40, 5, 30),
+            "Premium": np.append(rng.normal(100, 10, 29), np.nan),
+        })
+        self.test = pd.DataFrame({
+            "Age": rng.normal(42, 6, 25),
+            "Premium": rng.normal(101, 12, 25),
+        })
+
+    def test_numeric_welch_matches_scipy(self):
+        report = balance_checks.check_balance(self.control, self.test, ["Age", "Premium"])
+        for row in report.itertuples():
+            expected = stats.ttest_ind(self.control[row.feature].dropna(),
+                                       self.test[row.feature].dropna(), equal_var=False)
+            self.assertAlmostEqual(row.p_value, expected.pvalue)
+            self.assertAlmostEqual(row.mean_control, self.control[row.feature].mean())
+            self.assertAlmostEqual(row.mean_test, self.test[row.feature].mean())
+            self.assertEqual(row.balanced, expected.pvalue > 0.05)
+
+    def test_welch_kernel_matches_scipy(self):
+        a, b = self.control["Age"].to_numpy(), self.test["Age"].to_numpy()
+        t_stat, dof = balance_checks._welch_t(
+            np.array([a.mean()]), np.array([a.var(ddof=1)]), np.array([a.size], dtype=float),
+            np.array([b.mean()]), np.array([b.var(ddof=1)]), np.array([b.size], dtype=float))
+        expected = stats.ttest_ind(a, b, equal_var=False)
+        self.assertAlmostEqual(t_stat[0], expected.statistic)
+        self.assertAlmostEqual(2 * stats.t.sf(abs(t_stat[0]), dof[0]), expected.pvalue)
+
+
+class TestSegmentationBalance(unittest.TestCase):
+    def _reference(self, df_a, df_b, confounders, threshold=0.05):
+        # the per-column loop check_balance replaced
+        summary = []
+        for col in confounders:
+            if pd.api.types.is_numeric_dtype(df_a[col]):
+                val_a, val_b = df_a[col].mean(), df_b[col].mean()
+                summary.append((col, "numeric", val_a, val_b))
+            else:
+                prop_a = df_a[col].value_counts(normalize=True, dropna=False)
+                prop_b = df_b[col].value_counts(normalize=True, dropna=False)
+                for val in set(prop_a.index).union(prop_b.index):
+                    summary.append((col, "categorical", prop_a.get(val, 0), prop_b.get(val, 0)))
+        return sorted(summary, key=lambda r: (r[0], r[1], r[2], r[3]))
+
+    def test_matches_per_column_loop(self):
+        df = _policies()
+        df_a, df_b = segmentation.split_control_test(df, "Gender", "Male", "Female")
+        confounders = ["Province", "Margin", "ClaimFrequency"]
+        report = segmentation.check_balance(df_a, df_b, confounders)
+        got = sorted(zip(report["feature"], report["type"], report["value_a"], report["value_b"]),
+                     key=lambda r: (r[0], r[1], r[2], r[3]))
+        expected = self._reference(df_a, df_b, confounders)
+        self.assertEqual(len(got), len(expected))
+        for g, e in zip(got, expected):
+            self.assertEqual(g[:2], e[:2])
+            np.testing.assert_allclose(g[2:], e[2:])
+        np.testing.assert_array_equal(
+            report["imbalanced"].to_numpy(), (report["difference"].abs() > 0.05).to_numpy())
+
+    def test_level_missing_from_one_group_gets_zero(self):
+        df_a = pd.DataFrame({"Province": ["Gauteng", "Gauteng"]})
+        df_b = pd.DataFrame({"Province": ["Limpopo", "Gauteng"]})
+        report = segmentation.check_balance(df_a, df_b, ["Province"])
+        got = sorted(zip(report["value_a"], report["value_b"]))
+        self.assertEqual(got, [(0.0, 0.5), (1.0, 0.5)])
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            "TotalPremium": [100.0, 0.0, np.nan, 50.0, 1e-12],
+            "TotalClaims": [20.0, 5.0, 10.0, np.nan, 0.0],
+        })
+
+    def test_claim_flags_match_pandas(self):
+        freq = metrics.claim_frequency(self.df)
+        expected = (self.df["TotalClaims"].fillna(0) > 0).astype(int)
+        np.testing.assert_array_equal(freq.to_numpy(), expected.to_numpy())
+
+        severity = metrics.claim_severity(self.df)
+        expected = self.df["TotalClaims"].where(self.df["TotalClaims"] > 0)
+        np.testing.assert_array_equal(severity.to_numpy(), expected.to_numpy())
+        np.testing.assert_array_equal(
+            metrics.claim_severity(self.df, keep_na=False).to_numpy(), expected.fillna(0).to_numpy())
+
+    def test_margin_and_rate_match_separate_helpers(self):
+        m, rate = metrics.margin_and_rate(self.df)
+        pd.testing.assert_series_equal(m, metrics.margin(self.df))
+        pd.testing.assert_series_equal(rate, metrics.margin_rate(self.df))
+
+    def test_fast_path_matches_slow_path(self):
+        fast = metrics.attach_metrics_fast(self.df)
+        slow = metrics.attach_metrics(self.df.copy(), inplace=True)
+        pd.testing.assert_frame_equal(fast, slow, check_dtype=False)
+        self.assertNotIn("ClaimFrequency", self.df.columns)
+
+    def test_empty_frame(self):
+        out = metrics.attach_metrics(self.df.iloc[0:0])
+        self.assertEqual(len(out), 0)
+        self.assertIn("MarginRate", out.columns)
+
+
+class TestSafeMean(unittest.TestCase):
+    def test_matches_nanmean(self):
+        for values in ([1.0, 2.0, 4.0], [1.0, np.nan, 4.0], [1, 2, 3, 10], [7.5],
+                       np.array([1e8, 1e8 + 1, np.nan], dtype=np.float32)):
+            self.assertAlmostEqual(safe_mean(values), float(np.nanmean(np.array(values))), places=6)
+
+    def test_all_nan_and_empty_give_nan(self):
+        with np.errstate(invalid="ignore"), self.assertWarns(RuntimeWarning):
+            self.assertTrue(np.isnan(safe_mean([np.nan, np.nan])))
+        with np.errstate(invalid="ignore"), self.assertWarns(RuntimeWarning):
+            self.assertTrue(np.isnan(safe_mean([])))
+
+    def test_non_numeric_returns_none(self):
+        self.assertIsNone(safe_mean(["a", "b"]))
+
+
+class TestSafeStd(unittest.TestCase):
+    def test_matches_nanstd(self):
+        for values in ([1.0, 2.0, 4.0], [np.nan, 1.0, np.nan, 4.0], [1, 2, 3, 10], [7.5],
+                       [5.0, 5.0, 5.0]):
+            self.assertAlmostEqual(safe_std(values), float(np.nanstd(np.array(values, dtype=float))))
+
+    def test_large_offset_does_not_cancel(self):
+        values = 1e9 + np.array([0.0, 1.0, 2.0, np.nan])
+        self.assertAlmostEqual(safe_std(values), float(np.nanstd(values)))
+
+    def test_all_nan_and_empty_give_nan(self):
+        self.assertTrue(np.isnan(safe_std([np.nan, np.nan])))
+        self.assertTrue(np.isnan(safe_std([])))
+
+    def test_non_numeric_returns_none(self):
+        self.assertIsNone(safe_std(["a", "b"]))
+
+
+class TestAbPlotAggregates(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            "PostalCode": [2000, 2001, 2000, np.nan, 2002, 2000, 2001, 2003, 2002, 2000],
+            "Province": ["Gauteng", "Limpopo", "Gauteng", None, "Gauteng",
+                         "Limpopo", "Gauteng", "Gauteng", "Gauteng", "Gauteng"],
+            "ClaimFrequency": [1, 0, 0, 1, 1, np.nan, 0, 1, 0, 1],
+        })
+
+    def _reference(self, df, feature, top_n=None):
+        # the copy/value_counts/groupby path _freq_table replaced
+        data = df.copy()
+        if top_n:
+            top_vals = data[feature].value_counts().nlargest(top_n).index
+            data = data[data[feature].isin(top_vals)]
+        freq = data.groupby(feature)["ClaimFrequency"].mean().reset_index()
+        return freq.rename(columns={"ClaimFrequency": "Frequency"})
+
+    def test_freq_table_matches_groupby_mean(self):
+        for feature in ("PostalCode", "Province"):
+            for top_n in (None, 2, 10):
+                pd.testing.assert_frame_equal(
+                    ab_plots._freq_table(self.df, feature, top_n),
+                    self._reference(self.df, feature, top_n), check_dtype=False)
+
+    def test_single_level_and_empty(self):
+        single = self.df.assign(Province="Gauteng")
+        pd.testing.assert_frame_equal(ab_plots._freq_table(single, "Province"),
+                                      self._reference(single, "Province"), check_dtype=False)
+        self.assertEqual(len(ab_plots._freq_table(self.df.iloc[0:0], "Province")), 0)
+
+    def test_top_mask_matches_value_counts(self):
+        values = self.df["PostalCode"]
+        top_vals = values.value_counts().nlargest(2).index
+        np.testing.assert_array_equal(ab_plots._top_mask(values, 2), values.isin(top_vals).to_numpy())
+        self.assertFalse(ab_plots._top_mask(values, 10)[3])
+
+
+class TestTopValueCounts(unittest.TestCase):
+    def test_matches_value_counts_nlargest(self):
+        values = pd.Series(["b", "a", "a", "b", "c", None, "c", "d", "a"])
+        for top_n in (1, 2, 3, 10):
+            pd.testing.assert_series_equal(plots._top_value_counts(values, top_n),
+                                           values.value_counts().nlargest(top_n), check_dtype=False,
+                                           check_index_type=False)
+
+    def test_single_level_and_empty(self):
+        single = pd.Series(["a", "a"], name="Province")
+        pd.testing.assert_series_equal(plots._top_value_counts(single, 5),
+                                       single.value_counts().nlargest(5), check_dtype=False,
+                                       check_index_type=False)
+        self.assertEqual(len(plots._top_value_counts(pd.Series([], dtype=object), 5)), 0)
+
+
+class TestCorrelationMatrix(unittest.TestCase):
+    def tearDown(self):
+        plots.plt.close("all")
+
+    def test_clean_data_matches_pandas_corr(self):
+        rng = np.random.default_rng(2)
+        df = pd.DataFrame({"a": rng.normal(size=50), "b": rng.integers(0, 9, 50),
+                           "flat": np.ones(50), "text": ["x"] * 50})
+        df["c"] = df["a"] * 3 + rng.normal(size=50)
+        with mock.patch.object(plots, "_finish"):
+            corr = plots.correlation_matrix(df)
+        pd.testing.assert_frame_equal(corr, df.select_dtypes("number").corr(), atol=1e-5)
+
+    def test_missing_values_use_pairwise_corr(self):
+        df = pd.DataFrame({"a": [1.0, 2.0, np.nan, 4.0, 5.0], "b": [2.0, 1.0, 3.0, np.nan, 6.0]})
+        with mock.patch.object(plots, "_finish"):
+            corr = plots.correlation_matrix(df, ["a", "b"])
+        pd.testing.assert_frame_equal(corr, df.corr())
+
+    def test_single_column(self):
+        df = pd.DataFrame({"a": [1.0, 2.0, 4.0]})
+        with mock.patch.object(plots, "_finish"):
+            corr = plots.correlation_matrix(df)
+        pd.testing.assert_frame_equal(corr, df.corr(), atol=1e-6)
+
+
+class TestToF32(unittest.TestCase):
+    def test_downcasts_float64_arrays_series_and_frames(self):
+        arr = np.array([1.5, np.nan])
+        np.testing.assert_array_equal(_to_f32(arr), arr.astype(np.float32))
+        self.assertEqual(_to_f32(pd.Series(arr)).dtype, np.float32)
+        frame = _to_f32(pd.DataFrame({"x": arr, "n": [1, 2], "s": ["a", "b"]}))
+        self.assertEqual(frame.dtypes.tolist(), [np.float32, np.int64, frame["s"].dtype])
+
+    def test_other_dtypes_are_returned_as_is(self):
+        ints = np.array([1, 2])
+        self.assertIs(_to_f32(ints), ints)
+        f32 = pd.Series([1.0], dtype=np.float32)
+        self.assertIs(_to_f32(f32), f32)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from insurance_analytics.utils import io_utils
+
+
+class TestReadCsv(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+        self.csv_path = Path(tmp) / "policies.csv"
+        self.csv_path.write_text("Province,TotalClaims\nGauteng,1.5\nLimpopo,0\n")
+        self.cache_dir = Path(tmp) / "csv_cache"
+        patcher = mock.patch.object(io_utils, "_cache_dir", return_value=self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _cached_files(self):
+        return sorted(self.cache_dir.glob("*.parquet")) if self.cache_dir.exists() else []
+
+    def test_matches_pandas_without_cache(self):
+        df = io_utils.read_csv(self.csv_path)
+        pd.testing.assert_frame_equal(df, pd.read_csv(self.csv_path), check_dtype=False)
+        self.assertEqual(self._cached_files(), [])
+
+    def test_cache_is_reused_and_replaced_on_change(self):
+        first = io_utils.read_csv(self.csv_path, cache=True)
+        self.assertEqual(len(self._cached_files()), 1)
+        second = io_utils.read_csv(self.csv_path, cache=True)
+        pd.testing.assert_frame_equal(first, second)
+        self.assertIsNot(first, second)
+
+        # a new version of the file replaces its old cache entry
+        self.csv_path.write_text("Province,TotalClaims\nGauteng,2.5\n")
+        stat = self.csv_path.stat()
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        third = io_utils.read_csv(self.csv_path, cache=True)
+        self.assertEqual(third["TotalClaims"].tolist(), [2.5])
+        self.assertEqual(len(self._cached_files()), 1)
+
+    def test_chunked_read_yields_all_rows(self):
+        chunks = list(io_utils.iter_csv(self.csv_path, chunksize=1))
+        self.assertEqual([len(c) for c in chunks], [1, 1])
+
+    def test_missing_file_returns_none(self):
+        self.assertIsNone(io_utils.read_csv(self.csv_path.with_name("missing.csv")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import r2_score, roc_auc_score
+from sklearn.svm import LinearSVC
+
+from insurance_analytics.models import model_train as mt
+from insurance_analytics.models.data_split import ModelingDataPrep
+from insurance_analytics.models.model_train import ModelTrainer
+
+
+def _trainer(**kwargs):
+    preprocessor = ColumnTransformer([
+        ("num", StandardScaler(), ["PolicyID", "Premium"]),
+        ("cat", OneHotEncoder(handle_unknown="ignore"), ["Province"]),
+    ])
+    return ModelTrainer(preprocessor, ["PolicyID", "Premium"], ["Province"], **kwargs)
+
+
+class TestPrepareX(unittest.TestCase):
+    def setUp(self):
+        self.X = pd.DataFrame({
+            "PolicyID": np.array([2**24 + 1, 2**24 + 3, 7], dtype=np.int64),
+            "Premium": [10.5, np.nan, 3.25],
+            "Province": ["Gauteng", None, "Limpopo"],
+        })
+
+    def test_float32_policy_casts_only_float_columns(self):
+        Xc = _trainer(dtype_policy="float32")._prepare_X(self.X)
+        self.assertEqual(Xc["Premium"].dtype, np.float32)
+        self.assertEqual(Xc["PolicyID"].dtype.kind, "i")
+        # integers above 2**24 keep their exact values
+        np.testing.assert_array_equal(Xc["PolicyID"].to_numpy(), self.X["PolicyID"].to_numpy())
+
+    def test_caller_frame_is_not_modified(self):
+        before = self.X.copy()
+        _trainer()._prepare_X(self.X)
+        pd.testing.assert_frame_equal(self.X, before)
+
+
+def _reference_sanitize_categorical(df, cols, missing_token="MISSING"):
+    # the per-column loop sanitize_categorical_columns replaced
+    df = df.copy()
+    null_like = ["nan", "NaN", "None", "NONE", "NA", "N/A", "", " "]
+    for c in cols:
+        df[c] = df[c].replace(to_replace=null_like, value=np.nan)
+        df.loc[df[c].notna(), c] = df.loc[df[c].notna(), c].astype(str).str.strip()
+        df[c] = df[c].fillna(missing_token).astype(str)
+    return df
+
+
+class TestSanitizers(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            "Province": pd.Series([" Gauteng", "N/A", None, "Limpopo ", "", "nan"], dtype=object),
+            "Mixed": pd.Series([1, "  a ", np.nan, 2.5, "None", " "], dtype=object),
+            "Premium": ["10", "x", None, "3.5", "0", "7"],
+        })
+
+    def test_categorical_matches_per_column_loop(self):
+        cols = ["Province", "Mixed", "Absent"]
+        out = mt.sanitize_categorical_columns(self.df, cols)
+        expected = _reference_sanitize_categorical(self.df, ["Province", "Mixed"])
+        for c in ("Province", "Mixed"):
+            self.assertEqual(out[c].tolist(), expected[c].tolist())
+        self.assertNotIn("Absent", out.columns)
+        # the caller's frame keeps its raw values
+        self.assertEqual(self.df["Province"].iloc[0], " Gauteng")
+
+    def test_categorical_single_level_and_empty(self):
+        single = pd.DataFrame({"Province": ["Gauteng"] * 3})
+        self.assertEqual(mt.sanitize_categorical_columns(single, ["Province"])["Province"].tolist(),
+                         ["Gauteng"] * 3)
+        empty = self.df.iloc[0:0]
+        self.assertEqual(len(mt.sanitize_categorical_columns(empty, ["Province"])), 0)
+        pd.testing.assert_frame_equal(mt.sanitize_categorical_columns(self.df, []), self.df)
+
+    def test_numeric_matches_to_numeric(self):
+        expected = pd.to_numeric(self.df["Premium"], errors="coerce")
+        out = mt.sanitize_numeric_columns(self.df, ["Premium"])
+        np.testing.assert_array_equal(out["Premium"].to_numpy(dtype=float), expected.to_numpy())
+        raw = mt.sanitize_numeric_columns(self.df, ["Premium"], downcast=False)
+        pd.testing.assert_series_equal(raw["Premium"], expected)
+
+    def test_numeric_downcasts_integer_valued_floats(self):
+        df = pd.DataFrame({"n": [1.0, 2.0, 300.0], "f": [1.0, np.nan, 2.0]})
+        out = mt.sanitize_numeric_columns(df, ["n", "f"])
+        self.assertEqual(out["n"].dtype.kind, "i")
+        self.assertEqual(out["f"].dtype, np.float32)
+        np.testing.assert_array_equal(out["n"].to_numpy(), df["n"].to_numpy())
+
+
+class TestAutoDetect(unittest.TestCase):
+    def _reference(self, df, numeric_threshold=0.9):
+        numeric_cols, categorical_cols = [], []
+        for c in df.columns:
+            frac_numeric = pd.to_numeric(df[c], errors="coerce").notna().mean()
+            if frac_numeric >= numeric_threshold and df[c].nunique() > 10:
+                numeric_cols.append(c)
+            else:
+                categorical_cols.append(c)
+        return numeric_cols, categorical_cols
+
+    def test_matches_coerce_every_column(self):
+        n = 40
+        df = pd.DataFrame({
+            "Premium": np.append(np.arange(n - 1, dtype=float), np.nan),
+            "Sparse": np.where(np.arange(n) % 2, np.arange(n), np.nan),
+            "Code": np.arange(n) % 5,
+            "Text": [str(i) for i in range(n - 2)] + ["a", "b"],
+            "Province": ["Gauteng", "Limpopo"] * (n // 2),
+        })
+        self.assertEqual(mt.auto_detect_column_types(df), self._reference(df))
+
+    def test_sampled_estimate_on_long_columns(self):
+        df = pd.DataFrame({"Text": [str(i) for i in range(500)]})
+        self.assertEqual(mt.auto_detect_column_types(df, sample_size=50), self._reference(df))
+        self.assertEqual(mt.auto_detect_column_types(df.iloc[0:0]), ([], ["Text"]))
+
+
+class TestCapNJobs(unittest.TestCase):
+    def test_caps_negative_and_large_values(self):
+        self.assertEqual(mt._cap_n_jobs(RandomForestRegressor(n_jobs=-1), 2).n_jobs, 2)
+        self.assertEqual(mt._cap_n_jobs(RandomForestRegressor(n_jobs=8), 2).n_jobs, 2)
+        self.assertEqual(mt._cap_n_jobs(RandomForestRegressor(n_jobs=1), 2).n_jobs, 1)
+        self.assertIsNone(mt._cap_n_jobs(RandomForestRegressor(), 2).n_jobs)
+        self.assertIsNone(mt._cap_n_jobs(LinearRegression(), 2).n_jobs)
+        plain = object()
+        self.assertIs(mt._cap_n_jobs(plain, 2), plain)
+
+
+def _training_frame(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame({
+        "PolicyID": np.arange(n),
+        "Premium": rng.normal(100, 20, n),
+        "Province": rng.choice(["Gauteng", "Limpopo", " N/A"], n),
+    })
+    y_class = pd.Series((X["Premium"] + rng.normal(0, 10, n) > 100).astype(int))
+    y_reg = pd.Series(X["Premium"] * 2 + rng.normal(0, 5, n))
+    return X, y_class, y_reg
+
+
+class TestEvaluate(unittest.TestCase):
+    def test_classification_matches_pipeline_predictions(self):
+        X, y, _ = _training_frame()
+        trainer = _trainer()
+        trainer.train_classification_models(X.iloc[:40], y.iloc[:40])
+        report = trainer.evaluate_classification(X.iloc[40:], y.iloc[40:]).set_index("Model")
+        X_test = trainer._prepare_X(X.iloc[40:])
+        for name, pipeline in trainer.models.items():
+            expected = roc_auc_score(y.iloc[40:], pipeline.predict_proba(X_test)[:, 1])
+            self.assertAlmostEqual(report.loc[name, "AUC-ROC"], expected, places=6)
+            self.assertEqual(trainer._proba_kind[name], "proba")
+
+    def test_regression_matches_pipeline_predictions(self):
+        X, _, y = _training_frame()
+        trainer = _trainer()
+        trainer.train_regression_models(X.iloc[:40], y.iloc[:40])
+        report = trainer.evaluate_regression(X.iloc[40:], y.iloc[40:]).set_index("Model")
+        X_test = trainer._prepare_X(X.iloc[40:])
+        for name, pipeline in trainer.models.items():
+            expected = r2_score(y.iloc[40:], pipeline.predict(X_test))
+            self.assertAlmostEqual(report.loc[name, "R-squared"], expected, places=4)
+
+    def test_score_fallbacks_match_try_except_chain(self):
+        X = np.array([[0.0], [1.0], [2.0], [3.0]])
+        y = np.array([0, 0, 1, 1])
+        trainer = _trainer()
+        svc = LinearSVC().fit(X, y)
+        self.assertEqual(trainer._probe_proba_kind(svc), "decision")
+        np.testing.assert_allclose(trainer._safe_predict_proba_values(svc, X),
+                                   1 / (1 + np.exp(-svc.decision_function(X))))
+        ols = LinearRegression().fit(X, y)
+        self.assertEqual(trainer._probe_proba_kind(ols), "labels")
+        np.testing.assert_allclose(trainer._safe_predict_proba_values(ols, X), ols.predict(X))
+        # a failing scorer falls back to zeros, as before
+        unfitted = LinearSVC()
+        np.testing.assert_array_equal(trainer._safe_predict_proba_values(unfitted, X), np.zeros(4))
+
+
+def _modeling_frame():
+    return pd.DataFrame({
+        "PolicyID": range(8),
+        "TransactionMonth": pd.date_range("2015-01-01", periods=8, freq="MS"),
+        "Province": ["Gauteng", "Limpopo"] * 4,
+        "Premium": [10.0, 20.0, 15.0, np.nan, 8.0, 12.0, 30.0, 5.0],
+        "HasClaim": [1, 0, 1, 1, 0, 1, 0, 1],
+        "TotalClaims": [100, 0, "7", "x", 0, 3.5, 0, np.nan],
+    })
+
+
+class TestModelingDataPrep(unittest.TestCase):
+    def test_feature_partition_matches_select_dtypes(self):
+        prep = ModelingDataPrep(_modeling_frame())
+        X = prep.df[prep.FEATURE_COLS]
+        self.assertEqual(prep._num_cols, X.select_dtypes(exclude="object").columns.tolist())
+        self.assertEqual(prep._cat_cols, ["Province"])
+        self.assertEqual(prep.df["Premium"].dtype, np.float64)
+        preprocessor = prep.get_preprocessor().fit(X)
+        self.assertEqual(preprocessor.transform(X).shape, (8, 3))
+
+    def test_severity_target_matches_fillna_log1p(self):
+        prep = ModelingDataPrep(_modeling_frame())
+        X_train, X_test, y_train, y_test = prep.create_severity_split()
+        claims = prep.df.loc[prep.df["HasClaim"] == 1, "TotalClaims"]
+        expected = np.log1p(pd.to_numeric(claims, errors="coerce").fillna(0))
+        y = pd.concat([y_train, y_test]).sort_index()
+        np.testing.assert_allclose(y.to_numpy(), expected.to_numpy())
+
+
+if __name__ == "__main__":
+    unittest.main()
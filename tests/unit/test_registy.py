@@ -1,9 +1,11 @@
+import os
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
 from unittest import mock
 
-from insurance_analytics.core.registry import PathRegistry, Settings
+from insurance_analytics.core.registry import DEFAULT_STRUCTURE, PathRegistry, Settings
 
 # The config you provided (kept as a Python dict)
 SAMPLE_CONFIG = {
@@ -20,66 +22,86 @@ SAMPLE_CONFIG = {
     "artifacts": {"artifacts_dir": "artifacts"},
 }
 
+# SAMPLE_CONFIG's relative paths as Path objects, built once at import;
+# they are already normalized, so joining onto a resolved root is enough
+SAMPLE_CONFIG_RELS = {
+    section: {key: Path(rel) for key, rel in entries.items()}
+    for section, entries in SAMPLE_CONFIG.items()
+}
 
-class TestRegistryWithSampleConfig(unittest.TestCase):
-    def setUp(self):
-        # Temporary project root for each test
-        self._tmpdir = tempfile.TemporaryDirectory()
-        self.project_root = Path(self._tmpdir.name) / "project_root"
-        self.project_root.mkdir(parents=True, exist_ok=True)
+# One temporary base directory for the whole module; classes and tests
+# take plain mkdtemp subdirectories of it
+_BASE = None
+
+
+def setUpModule():
+    global _BASE
+    _BASE = tempfile.TemporaryDirectory()
 
-        # Patch validate_config_structure so tests don't depend on its implementation
-        self._validate_patcher = mock.patch(
+
+def tearDownModule():
+    _BASE.cleanup()
+
+
+class TestRegistryWithSampleConfig(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Patch validate_config_structure so tests don't depend on its implementation;
+        # class-scoped because the shared registry below is built under it
+        validate_patcher = mock.patch(
             "insurance_analytics.core.registry.validate_config_structure"
         )
-        self.mock_validate = self._validate_patcher.start()
+        mock_validate = validate_patcher.start()
+        cls.addClassCleanup(validate_patcher.stop)
+
+        # Registry shared by the read-only tests, built (and dirs created) once
+        shared_dir = tempfile.mkdtemp(dir=_BASE.name)
+        cls.addClassCleanup(shutil.rmtree, shared_dir, ignore_errors=True)
+        cls._shared_root = Path(shared_dir) / "project_root"
+        cls._shared_root.mkdir()
+        # resolved once; expected paths are then built with pure string ops
+        cls._resolved_shared_root = cls._shared_root.resolve()
+        cls._shared_existing = set()
+        cls._shared_registry = PathRegistry(
+            cls._shared_root, SAMPLE_CONFIG, create_dirs=True,
+            existing_dirs=cls._shared_existing)
+        cls._shared_validate_calls = list(mock_validate.call_args_list)
+
+    @property
+    def shared_registry(self) -> PathRegistry:
+        """Registry built once in setUpClass; tests must not modify it."""
+        return self._shared_registry
 
-    def tearDown(self):
-        self._validate_patcher.stop()
-        self._tmpdir.cleanup()
+    def setUp(self):
+        # Fresh project root per test, since tests create (or assert absence of) dirs
+        test_dir = tempfile.mkdtemp(dir=_BASE.name)
+        self.addCleanup(shutil.rmtree, test_dir, ignore_errors=True)
+        self.project_root = Path(test_dir) / "project_root"
+        self.project_root.mkdir(parents=True, exist_ok=True)
+        self.resolved_root = self.project_root.resolve()
 
     def test_all_paths_resolved_and_created(self):
         """Using SAMPLE_CONFIG -> every configured path should be resolved and directory created."""
-        registry = PathRegistry(
-            self.project_root, SAMPLE_CONFIG, create_dirs=True)
-
-        # Data section keys
-        for key, rel in SAMPLE_CONFIG["data"].items():
-            self.assertIn(key, registry.data,
-                          f"{key} missing from registry.data")
-            expected = (self.project_root / rel).resolve()
-            self.assertEqual(registry.data[key], expected)
-            self.assertTrue(expected.exists() and expected.is_dir())
-
-        # Logs
-        self.assertIn("logs_dir", registry.logs)
-        expected_logs = (self.project_root /
-                         SAMPLE_CONFIG["logs"]["logs_dir"]).resolve()
-        self.assertEqual(registry.logs["logs_dir"], expected_logs)
-        self.assertTrue(expected_logs.exists() and expected_logs.is_dir())
-
-        # Reports
-        for key, rel in SAMPLE_CONFIG["reports"].items():
-            self.assertIn(key, registry.reports)
-            expected = (self.project_root / rel).resolve()
-            self.assertEqual(registry.reports[key], expected)
-            self.assertTrue(expected.exists() and expected.is_dir())
-
-        # Models
-        self.assertIn("models_dir", registry.models)
-        expected_models = (self.project_root /
-                           SAMPLE_CONFIG["models"]["models_dir"]).resolve()
-        self.assertEqual(registry.models["models_dir"], expected_models)
-        self.assertTrue(expected_models.exists() and expected_models.is_dir())
-
-        # Artifacts
-        self.assertIn("artifacts_dir", registry.artifacts)
-        expected_artifacts = (
-            self.project_root / SAMPLE_CONFIG["artifacts"]["artifacts_dir"]).resolve()
-        self.assertEqual(
-            registry.artifacts["artifacts_dir"], expected_artifacts)
-        self.assertTrue(expected_artifacts.exists()
-                        and expected_artifacts.is_dir())
+        registry = self.shared_registry
+        project_root = self._resolved_shared_root
+
+        # One walk collects every existing directory; checks below are set lookups
+        existing = {
+            Path(dirpath) / name
+            for dirpath, dirnames, _ in os.walk(project_root)
+            for name in dirnames
+        }
+
+        # One dict comparison per section: registry sections hold the defaults
+        # merged with SAMPLE_CONFIG, so the expected dicts do the same
+        for section, rels in SAMPLE_CONFIG_RELS.items():
+            expected = {
+                key: project_root / rel
+                for key, rel in DEFAULT_STRUCTURE.get(section, {}).items()
+            }
+            expected.update({key: project_root / rel for key, rel in rels.items()})
+            self.assertDictEqual(getattr(registry, section), expected)
+            self.assertLessEqual(set(expected.values()), existing)
 
     def test_no_creation_when_create_dirs_false(self):
         """When create_dirs=False, the Path objects should still resolve but directories shouldn't be created."""
@@ -87,47 +109,60 @@ class TestRegistryWithSampleConfig(unittest.TestCase):
             self.project_root, SAMPLE_CONFIG, create_dirs=False)
 
         # Pick a subset to verify (if this passes for one, others are same logic)
-        expected_raw = (self.project_root /
-                        SAMPLE_CONFIG["data"]["raw_dir"]).resolve()
-        expected_models = (self.project_root /
-                           SAMPLE_CONFIG["models"]["models_dir"]).resolve()
+        expected_raw = self.resolved_root / SAMPLE_CONFIG_RELS["data"]["raw_dir"]
+        expected_models = (
+            self.resolved_root / SAMPLE_CONFIG_RELS["models"]["models_dir"])
 
         self.assertEqual(registry.data["raw_dir"], expected_raw)
         self.assertEqual(registry.models["models_dir"], expected_models)
 
-        self.assertFalse(expected_raw.exists(),
-                         "data/raw should not exist when create_dirs=False")
-        self.assertFalse(expected_models.exists(),
-                         "models dir should not exist when create_dirs=False")
+        # One directory read of the fresh root replaces a stat per path, and
+        # also catches any other directory created by mistake
+        with os.scandir(self.resolved_root) as entries:
+            created = sorted(entry.name for entry in entries)
+        self.assertEqual(created, [],
+                         "no directories should be created when create_dirs=False")
+
+    def test_known_existing_dirs_are_not_created_again(self):
+        """A registry sharing the existing_dirs set skips every stat and mkdir."""
+        with mock.patch("insurance_analytics.core.registry.os.makedirs") as mock_makedirs, \
+                mock.patch.object(Path, "is_dir") as mock_is_dir:
+            PathRegistry(self._shared_root, SAMPLE_CONFIG, create_dirs=True,
+                         existing_dirs=set(self._shared_existing))
+        mock_makedirs.assert_not_called()
+        mock_is_dir.assert_not_called()
+
+    def test_created_dirs_are_recorded_in_existing_dirs(self):
+        """Every resolved directory and its parents end up in the shared set."""
+        registry = self.shared_registry
+        for section in DEFAULT_STRUCTURE:
+            for path in getattr(registry, section).values():
+                self.assertIn(path, self._shared_existing)
+                self.assertIn(path.parent, self._shared_existing)
 
     def test_validate_config_structure_called_with_sample_config(self):
-        _ = PathRegistry(self.project_root, SAMPLE_CONFIG, create_dirs=False)
-        self.mock_validate.assert_called_once_with(SAMPLE_CONFIG)
+        # the shared registry's construction is the single call under test;
+        # it validates SAMPLE_CONFIG merged over DEFAULT_STRUCTURE
+        merged = {
+            section: {**defaults, **SAMPLE_CONFIG.get(section, {})}
+            for section, defaults in DEFAULT_STRUCTURE.items()
+        }
+        self.assertEqual(self._shared_validate_calls, [mock.call(merged)])
 
 
 class TestSettingsUsingSampleConfig(unittest.TestCase):
     def setUp(self):
-        # prepare temp project root and patch get_project_root to return it
-        self._tmpdir = tempfile.TemporaryDirectory()
-        self.project_root = Path(self._tmpdir.name) / "root"
+        # prepare temp project root; tests point get_project_root at it
+        test_dir = tempfile.mkdtemp(dir=_BASE.name)
+        self.addCleanup(shutil.rmtree, test_dir, ignore_errors=True)
+        self.project_root = Path(test_dir) / "root"
         self.project_root.mkdir(parents=True, exist_ok=True)
+        self.resolved_root = self.project_root.resolve()
 
-        self._validate_patcher = mock.patch(
-            "insurance_analytics.core.registry.validate_config_structure"
-        )
-        self._validate_patcher.start()
-
-        self._get_root_patcher = mock.patch(
-            "insurance_analytics.core.registry.get_project_root", return_value=self.project_root
-        )
-        self.mock_get_root = self._get_root_patcher.start()
-
-    def tearDown(self):
-        self._get_root_patcher.stop()
-        self._validate_patcher.stop()
-        self._tmpdir.cleanup()
-
-    def test_settings_exposes_properties_and_resolves_paths(self):
+    @mock.patch("insurance_analytics.core.registry.get_project_root")
+    @mock.patch("insurance_analytics.core.registry.validate_config_structure")
+    def test_settings_exposes_properties_and_resolves_paths(self, _mock_validate, mock_get_root):
+        mock_get_root.return_value = self.project_root
         settings = Settings(config=SAMPLE_CONFIG, create_dirs=True)
 
         # Ensure properties map to underlying PathRegistry dicts
@@ -140,23 +175,26 @@ class TestSettingsUsingSampleConfig(unittest.TestCase):
         # Verify at least one entry per section is correct
         self.assertIn("data_dir", settings.DATA)
         self.assertEqual(settings.DATA["data_dir"],
-                         (self.project_root / "data").resolve())
+                         self.resolved_root / SAMPLE_CONFIG_RELS["data"]["data_dir"])
 
         self.assertIn("logs_dir", settings.LOGS)
         self.assertEqual(settings.LOGS["logs_dir"],
-                         (self.project_root / "logs").resolve())
+                         self.resolved_root / SAMPLE_CONFIG_RELS["logs"]["logs_dir"])
 
         self.assertIn("reports_dir", settings.REPORTS)
         self.assertEqual(
-            settings.REPORTS["reports_dir"], (self.project_root / "reports").resolve())
+            settings.REPORTS["reports_dir"],
+            self.resolved_root / SAMPLE_CONFIG_RELS["reports"]["reports_dir"])
 
         self.assertIn("models_dir", settings.MODELS)
-        self.assertEqual(settings.MODELS["models_dir"], (
-            self.project_root / "src/insurance_analytics/models").resolve())
+        self.assertEqual(
+            settings.MODELS["models_dir"],
+            self.resolved_root / SAMPLE_CONFIG_RELS["models"]["models_dir"])
 
         self.assertIn("artifacts_dir", settings.ARTIFACTS)
         self.assertEqual(
-            settings.ARTIFACTS["artifacts_dir"], (self.project_root / "artifacts").resolve())
+            settings.ARTIFACTS["artifacts_dir"],
+            self.resolved_root / SAMPLE_CONFIG_RELS["artifacts"]["artifacts_dir"])
 
 
 if __name__ == "__main__":